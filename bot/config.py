@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from functools import cached_property
 
 from pydantic_settings import BaseSettings
 
@@ -18,9 +18,9 @@ class Settings(BaseSettings):
     RATE_LIMIT_SECONDS: int = 10
     DEDUP_SECONDS: int = 30
 
-    @property
-    def admin_ids(self) -> List[int]:
-        return [int(x.strip()) for x in self.ADMIN_CHAT_ID.split(",") if x.strip()]
+    @cached_property
+    def admin_ids(self) -> tuple[int, ...]:
+        return tuple(int(x.strip()) for x in self.ADMIN_CHAT_ID.split(",") if x.strip())
 
     model_config = {"env_file": ".env", "extra": "ignore"}
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from pathlib import Path
 from typing import Any
 
@@ -25,6 +26,36 @@ _MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
 # How long to wait for pool creation before giving up (seconds)
 _POOL_CREATE_TIMEOUT = 20
 
+# Pool sizing — enough warm connections that concurrent leads and admin
+# taps don't queue behind each other on a single connection.
+_POOL_MIN_SIZE = 4
+_POOL_MAX_SIZE = 20
+_COMMAND_TIMEOUT = 5
+# Migrations run whole .sql files — don't hold them to the hot-path timeout
+_MIGRATION_TIMEOUT = 60
+
+# get_lead() cache — admins tap "call" on the same card repeatedly and a
+# lead row only changes through update_lead_status(), which invalidates it.
+_LEAD_CACHE_TTL = 300
+_LEAD_CACHE_MAX = 1024
+_lead_cache: dict[int, tuple[float, dict[str, Any]]] = {}
+# Bumped on every status write; a fetch that straddles a bump may hold the
+# pre-update row and must not put it back into the cache.
+_lead_cache_gen = 0
+
+
+async def _create_pool() -> asyncpg.Pool:
+    # Wrap pool creation in asyncio.wait_for to prevent hanging
+    return await asyncio.wait_for(
+        asyncpg.create_pool(
+            settings.DATABASE_URL,
+            min_size=_POOL_MIN_SIZE,
+            max_size=_POOL_MAX_SIZE,
+            command_timeout=_COMMAND_TIMEOUT,
+        ),
+        timeout=_POOL_CREATE_TIMEOUT,
+    )
+
 
 async def init_db() -> None:
     """Connect to Postgres and run migrations.
@@ -38,16 +69,7 @@ async def init_db() -> None:
         return
 
     try:
-        # Wrap pool creation in asyncio.wait_for to prevent hanging
-        pool = await asyncio.wait_for(
-            asyncpg.create_pool(
-                settings.DATABASE_URL,
-                min_size=1,
-                max_size=10,
-                command_timeout=15,
-            ),
-            timeout=_POOL_CREATE_TIMEOUT,
-        )
+        pool = await _create_pool()
         await _run_migrations()
         logger.info("Database connected")
     except Exception as exc:
@@ -61,15 +83,7 @@ async def _retry_connect() -> None:
     for attempt in range(1, 40):
         await asyncio.sleep(15)
         try:
-            pool = await asyncio.wait_for(
-                asyncpg.create_pool(
-                    settings.DATABASE_URL,
-                    min_size=1,
-                    max_size=10,
-                    command_timeout=15,
-                ),
-                timeout=_POOL_CREATE_TIMEOUT,
-            )
+            pool = await _create_pool()
             await _run_migrations()
             logger.info("Database connected on retry #%d", attempt)
             return
@@ -84,7 +98,7 @@ async def _run_migrations() -> None:
     migration_files = sorted(_MIGRATIONS_DIR.glob("*.sql"))
     async with pool.acquire() as conn:
         for mf in migration_files:
-            await conn.execute(mf.read_text(encoding="utf-8"))
+            await conn.execute(mf.read_text(encoding="utf-8"), timeout=_MIGRATION_TIMEOUT)
     logger.info("Migrations applied: %d file(s)", len(migration_files))
 
 
@@ -140,10 +154,23 @@ async def save_lead(data: dict[str, Any]) -> int:
 
 
 async def get_lead(lead_id: int) -> dict[str, Any] | None:
+    """Fetch one lead.  Cached for a few minutes; each caller gets its own copy."""
+    now = time.monotonic()
+    hit = _lead_cache.get(lead_id)
+    if hit and hit[0] > now:
+        return dict(hit[1])
+    gen = _lead_cache_gen
     p = _check_pool()
     async with p.acquire(timeout=10) as conn:
         row = await conn.fetchrow("SELECT * FROM leads WHERE id = $1", lead_id)
-        return dict(row) if row else None
+    if not row:
+        return None
+    lead = dict(row)
+    if gen == _lead_cache_gen:
+        if len(_lead_cache) >= _LEAD_CACHE_MAX:
+            _lead_cache.pop(next(iter(_lead_cache)))
+        _lead_cache[lead_id] = (now + _LEAD_CACHE_TTL, dict(lead))
+    return lead
 
 
 async def get_leads(limit: int = 10) -> list[dict[str, Any]]:
@@ -156,13 +183,19 @@ async def get_leads(limit: int = 10) -> list[dict[str, Any]]:
 
 
 async def update_lead_status(lead_id: int, status: str) -> bool:
+    global _lead_cache_gen
     p = _check_pool()
-    async with p.acquire(timeout=10) as conn:
-        result = await conn.execute(
-            "UPDATE leads SET status = $1, updated_at = NOW() WHERE id = $2",
-            status, lead_id,
-        )
-        return result == "UPDATE 1"
+    try:
+        async with p.acquire(timeout=10) as conn:
+            result = await conn.execute(
+                "UPDATE leads SET status = $1, updated_at = NOW() WHERE id = $2",
+                status, lead_id,
+            )
+    finally:
+        # Even a failed call may have committed — invalidate either way
+        _lead_cache_gen += 1
+        _lead_cache.pop(lead_id, None)
+    return result == "UPDATE 1"
 
 
 async def export_all_leads() -> list[dict[str, Any]]:
@@ -0,0 +1,16 @@
+"""Custom aiogram filters."""
+
+from __future__ import annotations
+
+from aiogram.filters import BaseFilter
+from aiogram.types import CallbackQuery, Message
+
+from bot.config import settings
+
+
+class IsAdmin(BaseFilter):
+    """Pass only updates from users listed in ADMIN_CHAT_ID."""
+
+    async def __call__(self, event: Message | CallbackQuery) -> bool:
+        user = event.from_user
+        return user is not None and user.id in settings.admin_ids
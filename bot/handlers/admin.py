@@ -5,20 +5,25 @@ Admin commands:
 /status <id> STATUS — change status
 /export             — CSV dump
 /test               — test admin notification
+
+Inline buttons on lead notifications (adm:progress:<id>, adm:call:<id>)
+are handled here too, so they match before the funnel's callback routes.
 """
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
 import logging
 
-from aiogram import Bot, Router
+from aiogram import Bot, F, Router
 from aiogram.filters import Command
-from aiogram.types import BufferedInputFile, Message
+from aiogram.types import BufferedInputFile, CallbackQuery, Message
 
 from bot.config import settings
 from bot.db import export_all_leads, get_lead, get_leads, update_lead_status
+from bot.filters import IsAdmin
 
 logger = logging.getLogger(__name__)
 router = Router()
@@ -26,15 +31,12 @@ router = Router()
 VALID_STATUSES = {"NEW", "IN_PROGRESS", "WON", "LOST"}
 STATUS_EMOJI = {"NEW": "🆕", "IN_PROGRESS": "🔄", "WON": "✅", "LOST": "❌"}
 
-
-def _is_admin(user_id: int) -> bool:
-    return user_id in settings.admin_ids
+_ADM_PROGRESS_PREFIX = "adm:progress:"
+_ADM_CALL_PREFIX = "adm:call:"
 
 
-@router.message(Command("leads"))
+@router.message(Command("leads"), IsAdmin())
 async def cmd_leads(message: Message) -> None:
-    if not _is_admin(message.from_user.id):  # type: ignore[union-attr]
-        return
     args = (message.text or "").split()
     limit = int(args[1]) if len(args) > 1 and args[1].isdigit() else 10
     try:
@@ -56,10 +58,8 @@ async def cmd_leads(message: Message) -> None:
     await message.answer("\n".join(lines))
 
 
-@router.message(Command("lead"))
+@router.message(Command("lead"), IsAdmin())
 async def cmd_lead(message: Message) -> None:
-    if not _is_admin(message.from_user.id):  # type: ignore[union-attr]
-        return
     args = (message.text or "").split()
     if len(args) < 2 or not args[1].isdigit():
         await message.answer("Использование: <code>/lead 123</code>")
@@ -88,10 +88,8 @@ async def cmd_lead(message: Message) -> None:
     )
 
 
-@router.message(Command("status"))
+@router.message(Command("status"), IsAdmin())
 async def cmd_status(message: Message) -> None:
-    if not _is_admin(message.from_user.id):  # type: ignore[union-attr]
-        return
     args = (message.text or "").split()
     if len(args) < 3:
         await message.answer(
@@ -141,10 +139,8 @@ async def cmd_test(message: Message, bot: Bot) -> None:
     )
 
 
-@router.message(Command("export"))
+@router.message(Command("export"), IsAdmin())
 async def cmd_export(message: Message) -> None:
-    if not _is_admin(message.from_user.id):  # type: ignore[union-attr]
-        return
     try:
         leads = await export_all_leads()
     except Exception:
@@ -166,3 +162,52 @@ async def cmd_export(message: Message) -> None:
         writer.writerow(ld)
     doc = BufferedInputFile(buf.getvalue().encode("utf-8-sig"), filename="leads.csv")
     await message.answer_document(doc, caption=f"📊 {len(leads)} лидов")
+
+
+@router.message(Command("leads", "lead", "status", "export"))
+async def admin_only_denied(message: Message) -> None:
+    """Swallow admin commands from non-admins (don't forward them)."""
+
+
+# ── Inline buttons on lead notifications ─────────────────────
+
+@router.callback_query(F.data.startswith("adm:"), IsAdmin())
+async def admin_action(cb: CallbackQuery) -> None:
+    data = cb.data or ""
+    if data.startswith(_ADM_PROGRESS_PREFIX):
+        action, lead_id_str = "progress", data[len(_ADM_PROGRESS_PREFIX):]
+    elif data.startswith(_ADM_CALL_PREFIX):
+        action, lead_id_str = "call", data[len(_ADM_CALL_PREFIX):]
+    else:
+        await cb.answer()
+        return
+
+    # Validate before touching the DB — replayed/garbled buttons stop here
+    if not lead_id_str.isdecimal():
+        await cb.answer("⚠️ Некорректный номер лида")
+        return
+    lead_id = int(lead_id_str)
+
+    if action == "progress":
+        # The toast doesn't depend on the write — overlap the two round-trips.
+        # ensure_future is required: gather() hashes its arguments and an
+        # aiogram method object (what cb.answer returns) is unhashable.
+        updated, _ = await asyncio.gather(
+            update_lead_status(lead_id, "IN_PROGRESS"),
+            asyncio.ensure_future(cb.answer(f"✅ Лид #{lead_id} → В РАБОТЕ")),
+            return_exceptions=True,
+        )
+        if isinstance(updated, BaseException):
+            logger.error("adm:progress #%d failed: %s", lead_id, updated)
+        if updated is not True and cb.message:
+            # The toast already said "done" — correct it
+            await cb.message.answer(f"⚠️ Статус #{lead_id} не обновлён")
+    else:
+        lead = await get_lead(lead_id)
+        phone = lead.get("phone", "—") if lead else "—"
+        await cb.answer(f"📞 {phone}", show_alert=True)
+
+
+@router.callback_query(F.data.startswith("adm:"))
+async def admin_action_denied(cb: CallbackQuery) -> None:
+    await cb.answer("⛔ Только для администраторов", show_alert=True)
@@ -7,6 +7,7 @@ inline-button presses don't silently disappear.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from aiogram import Bot, F, Router
@@ -40,6 +41,21 @@ WELCOME_TEXT = (
     "👇 <b>Выберите услугу:</b>"
 )
 
+HELP_TEXT = (
+    "◈  <b>TE GROUP</b>  ·  Помощь\n\n"
+    f"  {_SEP}\n\n"
+    "Бот собирает параметры груза\n"
+    "и передаёт менеджеру для\n"
+    "точного расчёта стоимости.\n\n"
+    "  ▸ /start — Новая заявка\n"
+    "  ▸ /help — Это сообщение\n\n"
+    f"  {_SEP}\n\n"
+    "📞  +7 952 778 3680  <i>Россия</i>\n"
+    "📲  +996 501 989 469  <i>WhatsApp</i>\n"
+    "✉️  info@tegroup.cc\n"
+    "🌐  tegroup.cc"
+)
+
 
 # ═══════════════════════════════════════════════════════════════
 # /start
@@ -71,7 +87,11 @@ async def cmd_start(message: Message, state: FSMContext) -> None:
         )
 
 
-@router.message(F.text.regexp(r"(?i)^(start|старт|начать|привет|меню|menu)$"))
+# Plain-text synonyms for /start — matched with a set lookup, not a regex
+_START_WORDS = frozenset({"start", "старт", "начать", "привет", "меню", "menu"})
+
+
+@router.message(F.text.lower().in_(_START_WORDS))
 async def text_start(message: Message, state: FSMContext) -> None:
     await cmd_start(message, state)
 
@@ -82,20 +102,7 @@ async def text_start(message: Message, state: FSMContext) -> None:
 
 @router.message(Command("help"))
 async def cmd_help(message: Message) -> None:
-    await message.answer(
-        "◈  <b>TE GROUP</b>  ·  Помощь\n\n"
-        f"  {_SEP}\n\n"
-        "Бот собирает параметры груза\n"
-        "и передаёт менеджеру для\n"
-        "точного расчёта стоимости.\n\n"
-        "  ▸ /start — Новая заявка\n"
-        "  ▸ /help — Это сообщение\n\n"
-        f"  {_SEP}\n\n"
-        "📞  +7 952 778 3680  <i>Россия</i>\n"
-        "📲  +996 501 989 469  <i>WhatsApp</i>\n"
-        "✉️  info@tegroup.cc\n"
-        "🌐  tegroup.cc",
-    )
+    await message.answer(HELP_TEXT)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -160,14 +167,24 @@ async def fallback_forward(message: Message, bot: Bot, state: FSMContext) -> Non
         f"🆔  <code>{user.id}</code>"
     )
 
+    send, forward = bot.send_message, message.forward
+
+    async def _forward_to(admin_id: int) -> None:
+        # header first, then the original — order matters per admin only
+        await send(admin_id, header)
+        await forward(admin_id)
+
+    admin_ids = settings.admin_ids
+    results = await asyncio.gather(
+        *(_forward_to(admin_id) for admin_id in admin_ids),
+        return_exceptions=True,
+    )
     forwarded = False
-    for admin_id in settings.admin_ids:
-        try:
-            await bot.send_message(admin_id, header)
-            await message.forward(admin_id)
+    for admin_id, res in zip(admin_ids, results):
+        if isinstance(res, Exception):
+            logger.error("Forward to admin %s failed: %s", admin_id, res)
+        else:
             forwarded = True
-        except Exception as exc:
-            logger.error("Forward to admin %s failed: %s", admin_id, exc)
 
     if forwarded:
         await message.answer(
@@ -10,27 +10,32 @@ A single card message is edited at every step.  ← Назад on every step.
 
 from __future__ import annotations
 
+import asyncio
 import html as html_mod
 import logging
+import re
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+from typing import Any, AsyncIterator, Callable
 
 from aiogram import Bot, F, Router
+from aiogram.exceptions import TelegramAPIError, TelegramBadRequest
 from aiogram.fsm.context import FSMContext
-from aiogram.types import (
-    CallbackQuery,
-    InlineKeyboardMarkup,
-    Message,
-    ReplyKeyboardRemove,
-)
+from aiogram.fsm.state import State
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message
 
 from bot.config import settings
 from bot.db import save_lead
 from bot.keyboards import (
     CARGO_LABELS,
+    CB_ACTION_CALL,
+    CB_ACTION_RESTART,
+    CB_SKIP_COMMENT,
     COUNTRY_LABELS,
     CUSTOMS_URGENCY_INFO,
     CUSTOMS_URGENCY_LABELS,
     DEFAULT_DELIVERY,
-    DELIVERY_INFO,
+    DELIVERY_INFO_FLAT,
     INVOICE_LABELS,
     INVOICE_TO_FLOAT,
     SERVICE_LABELS,
@@ -47,14 +52,15 @@ from bot.keyboards import (
     customs_urgency_kb,
     invoice_kb,
     phone_kb,
+    remove_kb,
     service_kb,
     skip_comment_kb,
     urgency_kb,
     volume_kb,
     weight_kb,
-    with_back,
 )
 from bot.handlers.common import WELCOME_TEXT
+from bot.notify import enqueue
 from bot.states import OrderForm
 
 logger = logging.getLogger(__name__)
@@ -65,13 +71,80 @@ _SEP = "· · ·"
 TOTAL_CUSTOMS = 5
 TOTAL_DELIVERY = 7
 
+# ── Back-button callback data (one definition, shared by all handlers) ──
+_BACK_SERVICE = "back:service"
+_BACK_C_CARGO = "back:c_cargo_reset"
+_BACK_C_COUNTRY = "back:c_country_reset"
+_BACK_C_INVOICE = "back:c_invoice_reset"
+_BACK_D_COUNTRY = "back:d_country_reset"
+_BACK_D_CITY = "back:d_city_reset"
+_BACK_D_CARGO = "back:d_cargo_reset"
+_BACK_D_WEIGHT = "back:d_weight_reset"
+_BACK_D_VOLUME = "back:d_volume_reset"
+
+# ── Callback-data prefixes (sliced off instead of split) ─────
+_SERVICE_PREFIX_LEN = len("service:")
+_CARGO_PREFIX_LEN = len("cargo:")
+_COUNTRY_PREFIX_LEN = len("country:")
+_INVOICE_PREFIX_LEN = len("invoice:")
+_CURGENCY_PREFIX_LEN = len("curgency:")
+_CITY_PREFIX_LEN = len("city:")
+_WEIGHT_PREFIX_LEN = len("weight:")
+_VOLUME_PREFIX_LEN = len("volume:")
+_URGENCY_PREFIX_LEN = len("urgency:")
+_BACK_PREFIX_LEN = len("back:")
+
+# Separators people type inside phone numbers
+_PHONE_STRIP = str.maketrans("", "", " -().")
+
+# Free-text amounts: plain positive number, "." or "," as decimal mark
+_NUM_RE = re.compile(r"\d+(?:[.,]\d+)?")
+
+# ── Step prompts ─────────────────────────────────────────────
+_PROMPT_C_COUNTRY = "🌍 <b>Откуда отправляется товар?</b>"
+_PROMPT_D_COUNTRY = "🌍 <b>Страна отправления?</b>"
+_PROMPT_COUNTRY_TEXT = "🌍 <b>Введите название страны:</b>"
+_PROMPT_CITY = "📍 <b>Город отправления?</b>"
+_PROMPT_CITY_ENTER = "📍 <b>Введите город отправления:</b>"
+_PROMPT_CITY_TEXT = "📍 <b>Введите название города:</b>"
+_PROMPT_CARGO = "📦 <b>Тип груза?</b>"
+_PROMPT_WEIGHT = "⚖️ <b>Примерный вес?</b>"
+_PROMPT_WEIGHT_TEXT = "⚖️ <b>Введите вес в кг:</b>"
+_PROMPT_VOLUME = "📐 <b>Примерный объём?</b>"
+_PROMPT_VOLUME_TEXT = "📐 <b>Введите объём в м³:</b>"
+_PROMPT_INVOICE = "💰 <b>Примерная стоимость партии?</b>"
+_PROMPT_INVOICE_TEXT = "💰 <b>Введите сумму в USD:</b>"
+_PROMPT_URGENCY = "⏰ <b>Насколько срочно?</b>"
+_PROMPT_PHONE = "📱 <b>Номер телефона для связи:</b>"
+_PHONE_HINT = "Нажмите кнопку или введите номер вручную 👇"
+_PROMPT_COMMENT = (
+    "💬 <b>Комментарий к заявке?</b>\n\n"
+    "<i>Напишите текст или нажмите «Пропустить»</i>"
+)
+
 
 # ═══════════════════════════════════════════════════════════════
 # HELPERS
 # ═══════════════════════════════════════════════════════════════
 
 def _e(val: object) -> str:
-    return html_mod.escape(str(val or ""))
+    # Telegram's HTML mode only needs &, < and > escaped; skipping the
+    # quote pass saves two replace() scans per value.
+    return html_mod.escape(str(val or ""), quote=False)
+
+
+def _escaped(labels: dict[str, str]) -> dict[str, str]:
+    return {k: _e(v) for k, v in labels.items()}
+
+
+# HTML-escaped label tables — labels are static, so escape them once
+_CARGO_E = _escaped(CARGO_LABELS)
+_COUNTRY_E = _escaped(COUNTRY_LABELS)
+_INVOICE_E = _escaped(INVOICE_LABELS)
+_CUSTOMS_URGENCY_E = _escaped(CUSTOMS_URGENCY_LABELS)
+_WEIGHT_E = _escaped(WEIGHT_LABELS)
+_VOLUME_E = _escaped(VOLUME_LABELS)
+_URGENCY_E = _escaped(URGENCY_LABELS)
 
 
 def _bar(step: int, total: int) -> str:
@@ -82,62 +155,86 @@ def _bar(step: int, total: int) -> str:
     return f"<i>{filled}{empty}  {step}/{total}</i>"
 
 
-def _card(data: dict, step: int, question: str = "") -> str:
-    """Build the single-card message for the current funnel state."""
-    service = data.get("service", "delivery")
-    total = TOTAL_CUSTOMS if service == "customs" else TOTAL_DELIVERY
+_HEADER_CUSTOMS = "◈  <b>TE GROUP</b>  ·  🛃 Таможня"
+_HEADER_DELIVERY = "◈  <b>TE GROUP</b>  ·  🚚 Доставка"
+
 
+def _build_card_head(service: str, step: int) -> str:
     if service == "customs":
-        header = "◈  <b>TE GROUP</b>  ·  🛃 Таможня"
+        header, total = _HEADER_CUSTOMS, TOTAL_CUSTOMS
     else:
-        header = "◈  <b>TE GROUP</b>  ·  🚚 Доставка"
-
-    lines: list[str] = [header]
+        header, total = _HEADER_DELIVERY, TOTAL_DELIVERY
     bar = _bar(step, total)
-    if bar:
-        lines.append(bar)
-    lines.append("")
+    return f"{header}\n{bar}" if bar else header
+
+
+# Header + progress bar for every reachable (service, step), built at import
+_CARD_HEADS: dict[tuple[str, int], str] = {
+    (service, step): _build_card_head(service, step)
+    for service, total in (("customs", TOTAL_CUSTOMS), ("delivery", TOTAL_DELIVERY))
+    for step in range(total + 1)
+}
+
+
+def _card_head(service: str, step: int) -> str:
+    head = _CARD_HEADS.get((service, step))
+    return head if head is not None else _build_card_head(service, step)
+
+
+def _card(data: dict, step: int, question: str = "") -> str:
+    """Build the single-card message for the current funnel state."""
+    return _render_card(
+        data.get("service", "delivery"), step, question,
+        data.get("cargo_type", ""), data.get("country", ""), data.get("city_from", ""),
+        data.get("invoice_value", ""), data.get("customs_urgency", ""),
+        data.get("weight_kg", ""), data.get("volume_m3", ""), data.get("urgency", ""),
+    )
 
-    fields: list[str] = []
 
+@lru_cache(maxsize=2048)
+def _render_card(
+    service: str, step: int, question: str,
+    cargo_type: str, country: str, city_from: str,
+    invoice_value: str, customs_urgency: str,
+    weight_kg: str, volume_m3: str, urgency: str,
+) -> str:
+    """Pure renderer behind _card — many users share the same selections."""
     if service == "customs":
-        if data.get("cargo_type"):
-            fields.append(f"  📦  {_e(CARGO_LABELS.get(data['cargo_type'], data['cargo_type']))}")
-        if data.get("country"):
-            fields.append(f"  🌍  {_e(COUNTRY_LABELS.get(data['country'], data['country']))}")
-        if data.get("invoice_value"):
-            fields.append(f"  💰  {_e(INVOICE_LABELS.get(data['invoice_value'], data['invoice_value']))}")
-        if data.get("customs_urgency"):
-            lbl = CUSTOMS_URGENCY_LABELS.get(data["customs_urgency"], data["customs_urgency"])
-            fields.append(f"  ⏰  {_e(lbl)}")
+        fields = _card_customs(cargo_type, country, invoice_value, customs_urgency)
     else:
-        if data.get("country"):
-            fields.append(f"  🌍  {_e(COUNTRY_LABELS.get(data['country'], data['country']))}")
-        if data.get("city_from"):
-            fields.append(f"  📍  {_e(data['city_from'])}")
-        if data.get("cargo_type"):
-            fields.append(f"  📦  {_e(CARGO_LABELS.get(data['cargo_type'], data['cargo_type']))}")
-        if data.get("weight_kg"):
-            fields.append(f"  ⚖️  {_e(WEIGHT_LABELS.get(data['weight_kg'], data['weight_kg']))}")
-        if data.get("volume_m3"):
-            fields.append(f"  📐  {_e(VOLUME_LABELS.get(data['volume_m3'], data['volume_m3']))}")
-        if data.get("urgency"):
-            lbl = URGENCY_LABELS.get(data["urgency"], data["urgency"])
-            fields.append(f"  ⏰  {_e(lbl)}")
-            info = DELIVERY_INFO.get(data.get("country", ""), DEFAULT_DELIVERY).get(data["urgency"], "")
-            if info:
-                fields.append(f"        <i>{_e(info)}</i>")
-
-    if fields:
-        lines.extend(fields)
-
-    if question:
-        lines.append("")
-        lines.append(f"  {_SEP}")
-        lines.append("")
-        lines.append(question)
-
-    return "\n".join(lines)
+        fields = _card_delivery(country, city_from, cargo_type, weight_kg, volume_m3, urgency)
+    tail = f"\n\n  {_SEP}\n\n{question}" if question else ""
+    return f"{_card_head(service, step)}\n{fields}{tail}"
+
+
+def _card_customs(cargo_type: str, country: str, invoice_value: str, customs_urgency: str) -> str:
+    return (
+        (f"\n  📦  {(_CARGO_E.get(cargo_type) or _e(cargo_type))}" if cargo_type else "")
+        + (f"\n  🌍  {(_COUNTRY_E.get(country) or _e(country))}" if country else "")
+        + (f"\n  💰  {(_INVOICE_E.get(invoice_value) or _e(invoice_value))}" if invoice_value else "")
+        + (
+            f"\n  ⏰  {(_CUSTOMS_URGENCY_E.get(customs_urgency) or _e(customs_urgency))}"
+            if customs_urgency else ""
+        )
+    )
+
+
+def _card_delivery(
+    country: str, city_from: str, cargo_type: str,
+    weight_kg: str, volume_m3: str, urgency: str,
+) -> str:
+    info = ""
+    if urgency:
+        info = DELIVERY_INFO_FLAT.get((country, urgency)) or DEFAULT_DELIVERY.get(urgency, "")
+    return (
+        (f"\n  🌍  {(_COUNTRY_E.get(country) or _e(country))}" if country else "")
+        + (f"\n  📍  {_e(city_from)}" if city_from else "")
+        + (f"\n  📦  {(_CARGO_E.get(cargo_type) or _e(cargo_type))}" if cargo_type else "")
+        + (f"\n  ⚖️  {(_WEIGHT_E.get(weight_kg) or _e(weight_kg))}" if weight_kg else "")
+        + (f"\n  📐  {(_VOLUME_E.get(volume_m3) or _e(volume_m3))}" if volume_m3 else "")
+        + (f"\n  ⏰  {(_URGENCY_E.get(urgency) or _e(urgency))}" if urgency else "")
+        + (f"\n        <i>{_e(info)}</i>" if info else "")
+    )
 
 
 async def _edit(
@@ -148,9 +245,13 @@ async def _edit(
     try:
         await bot.edit_message_text(text, chat_id=chat_id, message_id=msg_id, reply_markup=markup)
         return msg_id
-    except Exception:
-        new = await bot.send_message(chat_id, text, reply_markup=markup)
-        return new.message_id
+    except TelegramBadRequest as exc:
+        if "message is not modified" in exc.message:
+            return msg_id
+    except TelegramAPIError:
+        pass
+    new = await bot.send_message(chat_id, text, reply_markup=markup)
+    return new.message_id
 
 
 def _card_id(data: dict, cb: CallbackQuery | None = None) -> int:
@@ -160,118 +261,259 @@ def _card_id(data: dict, cb: CallbackQuery | None = None) -> int:
     return mid
 
 
+@asynccontextmanager
+async def _acked(cb: CallbackQuery) -> AsyncIterator[None]:
+    """Start answering the callback right away so the button spinner
+    clears while the handler is still editing; the answer is awaited on
+    the way out, also when the body raises."""
+    ack = asyncio.ensure_future(cb.answer())
+    try:
+        yield
+    finally:
+        try:
+            await ack
+        except TelegramAPIError as exc:
+            logger.warning("%s answer failed: %s", cb.data, exc)
+
+
+async def _advance_text(
+    message: Message, state: FSMContext, bot: Bot,
+    step: int, question: str, markup: InlineKeyboardMarkup | None,
+    next_state: State, **fields: Any,
+) -> None:
+    """Typed-input step: fold *fields* into the card, re-render it, move on."""
+    data = await state.get_data()
+    data.update(fields)
+    new_id = await _edit(bot, message.chat.id, _card_id(data), _card(data, step, question), markup)
+    await state.update_data(fields, card_id=new_id)
+    await state.set_state(next_state)
+
+
+async def _advance_cb(
+    cb: CallbackQuery, state: FSMContext,
+    step: int, question: str, markup: InlineKeyboardMarkup,
+    next_state: State, **fields: Any,
+) -> None:
+    """Button step: store *fields*, redraw the card in place, move on."""
+    async with _acked(cb):
+        data = await state.update_data(fields)
+        try:
+            await cb.message.edit_text(_card(data, step, question), reply_markup=markup)  # type: ignore[union-attr]
+        except Exception as exc:
+            logger.warning("%s edit failed: %s", cb.data, exc)
+        await state.set_state(next_state)
+
+
+async def _ask_typed(cb: CallbackQuery, state: FSMContext, step: int, question: str) -> None:
+    """"Other…" button: swap the card's keyboard for a type-it-in prompt."""
+    async with _acked(cb):
+        data = await state.get_data()
+        try:
+            await cb.message.edit_text(_card(data, step, question))  # type: ignore[union-attr]
+        except Exception:
+            pass
+
+
+async def _show_phone_step(bot: Bot, chat_id: int, card_id: int, card_text: str) -> int:
+    """Show the pre-rendered phone card and the contact-share keyboard.
+
+    Returns the (possibly new) card message id.  A reply keyboard can't
+    ride on an inline-message edit, so the hint is a separate message —
+    sent only after the edit, since ``_edit`` may fall back to sending a
+    new card and the hint must land below it.
+    """
+    try:
+        card_id = await _edit(bot, chat_id, card_id, card_text)
+    except Exception as exc:
+        logger.warning("phone step edit failed: %s", exc)
+    try:
+        await bot.send_message(chat_id, _PHONE_HINT, reply_markup=phone_kb())
+    except Exception as exc:
+        logger.warning("phone step phone_kb failed: %s", exc)
+    return card_id
+
+
 # ═══════════════════════════════════════════════════════════════
 # ADMIN NOTIFICATION
 # ═══════════════════════════════════════════════════════════════
 
-async def _notify_admins(bot: Bot, lead_id: int, data: dict, service: str) -> bool:
-    """Send a premium-styled lead notification to all admins."""
-    svc_map = {
-        "customs": "🛃 Таможня",
-        "delivery": "🚚 Доставка",
-        "question": "💬 Вопрос",
-    }
-    svc = svc_map.get(service, service)
+_SVC_TITLES = {
+    "customs": "🛃 Таможня",
+    "delivery": "🚚 Доставка",
+    "question": "💬 Вопрос",
+}
+
+
+def _fmt_customs(data: dict) -> str:
+    cargo_key = data.get("cargo_type", "")
+    country_key = data.get("country", "")
+    inv_key = data.get("invoice_value", "")
+    # urgency is stored as "urgency" in lead_data (merged from customs_urgency)
+    raw_urg = data.get("customs_urgency", "") or data.get("urgency", "")
+    cargo = _CARGO_E.get(cargo_key) or _e(cargo_key)
+    country = _COUNTRY_E.get(country_key) or _e(country_key)
+    inv = _INVOICE_E.get(inv_key) or _e(inv_key)
+    urg = _CUSTOMS_URGENCY_E.get(raw_urg) or _e(raw_urg)
+    return (
+        "\n"
+        + (f"\n🌍  {country}" if country else "")
+        + (f"\n📦  {cargo}" if cargo else "")
+        + (f"\n💰  {inv}" if inv else "")
+        + (f"\n⏰  {urg}" if urg else "")
+    )
+
 
-    # ── Header ──────────────────────────────────────────────
+def _fmt_question(data: dict) -> str:
+    tg_id = data.get("telegram_id", "")
+    return f"\n🆔  <code>{tg_id}</code>" if tg_id else ""
+
+
+def _fmt_delivery(data: dict) -> str:
+    country_key = data.get("country", "")
+    cargo_key = data.get("cargo_type", "")
+    country = _COUNTRY_E.get(country_key) or _e(country_key)
+    city = _e(data.get("city_from", ""))
+    cargo = _CARGO_E.get(cargo_key) or _e(cargo_key)
+    weight = data.get("weight_kg", 0)
+    volume = data.get("volume_m3", 0)
+    urg = _URGENCY_E.get(data.get("urgency", ""), "")
+
+    if country and city:
+        route = f"\n🌍  {country}  →  {city}"
+    elif country:
+        route = f"\n🌍  {country}"
+    else:
+        route = ""
+    if weight and volume:
+        dims = f"\n⚖️ {weight} кг  ·  📐 {volume} м³"
+    elif weight:
+        dims = f"\n⚖️ {weight} кг"
+    elif volume:
+        dims = f"\n📐 {volume} м³"
+    else:
+        dims = ""
+    return (
+        "\n"
+        + route
+        + (f"\n📦  {cargo}" if cargo else "")
+        + dims
+        + (f"\n⏰  {urg}" if urg else "")
+    )
+
+
+def _admin_text(lead_id: int, data: dict, service: str) -> str:
+    svc = _SVC_TITLES.get(service, service)
     if lead_id:
         header = f"🆕  <b>Заявка #{lead_id}</b>  ·  {svc}"
     else:
         header = f"🆕  <b>Новая заявка</b>  ·  {svc}"
 
-    # ── Common user info ────────────────────────────────────
     name = _e(data.get("full_name", ""))
     uname = data.get("username", "")
     phone = _e(data.get("phone", ""))
     comment = data.get("comment", "")
 
-    user_line = f"👤  {name}" if name else "👤  —"
-    if uname:
-        user_line += f"  ·  @{_e(uname)}"
-
-    lines: list[str] = [header, ""]
-    lines.append(user_line)
+    if service == "customs":
+        body = _fmt_customs(data)
+    elif service == "question":
+        body = _fmt_question(data)
+    else:
+        body = _fmt_delivery(data)
+
+    return (
+        f"{header}\n\n👤  {name or '—'}"
+        + (f"  ·  @{_e(uname)}" if uname else "")
+        + (f"\n📞  {phone}" if phone else "")
+        + body
+        + (f"\n\n💬  <i>{_e(comment)}</i>" if comment else "")
+    )
 
-    if phone:
-        lines.append(f"📞  {phone}")
 
-    # ── Service-specific fields ────────────────────────────
-    if service == "customs":
-        cargo = _e(CARGO_LABELS.get(data.get("cargo_type", ""), data.get("cargo_type", "")))
-        country = _e(COUNTRY_LABELS.get(data.get("country", ""), data.get("country", "")))
-        inv = _e(INVOICE_LABELS.get(data.get("invoice_value", ""), data.get("invoice_value", "")))
-        # urgency is stored as "urgency" in lead_data (merged from customs_urgency)
-        raw_urg = data.get("customs_urgency", "") or data.get("urgency", "")
-        urg = _e(CUSTOMS_URGENCY_LABELS.get(raw_urg, raw_urg))
-
-        lines.append("")
-        if country:
-            lines.append(f"🌍  {country}")
-        if cargo:
-            lines.append(f"📦  {cargo}")
-        if inv:
-            lines.append(f"💰  {inv}")
-        if urg:
-            lines.append(f"⏰  {urg}")
+async def _notify_admins(bot: Bot, lead_id: int, data: dict, service: str) -> bool:
+    """Queue a premium-styled lead notification for all admins.
 
-    elif service == "question":
-        tg_id = data.get("telegram_id", "")
-        if tg_id:
-            lines.append(f"🆔  <code>{tg_id}</code>")
-
-    else:  # delivery
-        country = _e(COUNTRY_LABELS.get(data.get("country", ""), data.get("country", "")))
-        city = _e(data.get("city_from", ""))
-        cargo = _e(CARGO_LABELS.get(data.get("cargo_type", ""), data.get("cargo_type", "")))
-        weight = data.get("weight_kg", 0)
-        volume = data.get("volume_m3", 0)
-        urg = _e(URGENCY_LABELS.get(data.get("urgency", ""), ""))
-
-        lines.append("")
-        if country and city:
-            lines.append(f"🌍  {country}  →  {city}")
-        elif country:
-            lines.append(f"🌍  {country}")
-        if cargo:
-            lines.append(f"📦  {cargo}")
-
-        dims: list[str] = []
-        if weight:
-            dims.append(f"⚖️ {weight} кг")
-        if volume:
-            dims.append(f"📐 {volume} м³")
-        if dims:
-            lines.append(f"{'  ·  '.join(dims)}")
-
-        if urg:
-            lines.append(f"⏰  {urg}")
-
-    # ── Comment ─────────────────────────────────────────────
-    if comment:
-        lines.append("")
-        lines.append(f"💬  <i>{_e(comment)}</i>")
-
-    text = "\n".join(lines)
+    Returns True if at least one copy was queued — delivery happens later
+    in the notify workers (see bot.notify), not before this returns.
+    """
+    text = _admin_text(lead_id, data, service)
 
     # ── Send to admins (with action buttons if we have a lead) ──
     markup = admin_lead_kb(lead_id) if lead_id else None
 
-    ok = False
+    # Hand off to the notify workers — the user isn't kept waiting on
+    # Telegram round-trips, and 429s are retried there.
+    queued = False
     for admin_id in settings.admin_ids:
-        try:
-            await bot.send_message(admin_id, text, reply_markup=markup)
-            ok = True
-        except Exception as exc:
-            logger.error("Notify admin %s failed: %s", admin_id, exc)
-    return ok
+        queued = enqueue(bot, admin_id, text, markup) or queued
+    return queued
 
 
 # ═══════════════════════════════════════════════════════════════
 # FINISH ORDER
 # ═══════════════════════════════════════════════════════════════
 
-async def _finish(msg: Message, state: FSMContext, bot: Bot) -> None:
-    data = await state.get_data()
+# Longest we hold the admin alert waiting for the INSERT to return an id
+_SAVE_LEAD_TIMEOUT = 5
+
+
+async def _save_lead_bounded(bot: Bot, lead_data: dict, service: str) -> int:
+    """save_lead(), but give up waiting after _SAVE_LEAD_TIMEOUT seconds.
+
+    The INSERT itself is capped by the pool's command_timeout (also 5 s),
+    so a timeout here in practice means save_lead is still waiting in
+    pool.acquire().  It is left running and 0 is returned, so admins are
+    alerted (without an id) instead of stalling; if the save then lands,
+    _on_late_save sends them a follow-up with the id and action buttons.
+    """
+    task = asyncio.create_task(save_lead(lead_data))
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), _SAVE_LEAD_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("save_lead slow — notifying admins without lead id")
+        task.add_done_callback(partial(_on_late_save, bot, lead_data, service))
+        return 0
+
+
+def _on_late_save(bot: Bot, lead_data: dict, service: str, task: asyncio.Task) -> None:
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc:
+        logger.error("Late save_lead failed: %s", exc)
+        return
+    lead_id = task.result()
+    logger.info("Late save_lead stored lead #%d", lead_id)
+    text = "🔁  <i>Сохранена с задержкой — повтор с номером заявки</i>\n\n" + _admin_text(
+        lead_id, lead_data, service,
+    )
+    markup = admin_lead_kb(lead_id)
+    for admin_id in settings.admin_ids:
+        enqueue(bot, admin_id, text, markup)
+
+
+_LEAD_ACCEPTED_TMPL = (
+    "◈  <b>TE GROUP</b>\n\n"
+    f"  {_SEP}\n\n"
+    "✅  <b>Заявка #{lead_id} принята</b>\n\n"
+    "  {svc_line}\n\n"
+    "  Менеджер рассчитает стоимость\n"
+    "  и свяжется <b>в течение 1 часа</b>.\n\n"
+    f"  {_SEP}\n\n"
+    "  Спасибо за обращение!"
+)
+
+# No lead id (save failed or still pending) but the admin alert was queued
+_LEAD_SENT_TEXT = (
+    "◈  <b>TE GROUP</b>\n\n"
+    f"  {_SEP}\n\n"
+    "✅  <b>Заявка отправлена менеджеру</b>\n\n"
+    "  Свяжемся <b>в течение 1 часа</b>.\n\n"
+    f"  {_SEP}\n\n"
+    "  Спасибо за обращение!"
+)
+
+
+async def _finish(msg: Message, state: FSMContext, bot: Bot, data: dict) -> None:
     user = msg.from_user
     service = data.get("service", "delivery")
 
@@ -288,8 +530,8 @@ async def _finish(msg: Message, state: FSMContext, bot: Bot) -> None:
         "country": data.get("country", ""),
         "city_from": data.get("city_from", ""),
         "cargo_type": data.get("cargo_type", ""),
-        "weight_kg": _resolve_weight(data.get("weight_kg", "0")),
-        "volume_m3": _resolve_volume(data.get("volume_m3", "0")),
+        "weight_kg": data.get("weight_kg_num") or 0.0,
+        "volume_m3": data.get("volume_m3_num") or 0.0,
         "urgency": data.get("urgency", "") or data.get("customs_urgency", ""),
         "incoterms": "",
         "phone": data.get("phone", ""),
@@ -302,28 +544,21 @@ async def _finish(msg: Message, state: FSMContext, bot: Bot) -> None:
     # Save to DB (non-fatal — we still notify admins if this fails)
     lead_id = 0
     try:
-        lead_id = await save_lead(lead_data)
-    except Exception:
-        logger.exception("save_lead failed — will still notify admins")
+        lead_id = await _save_lead_bounded(bot, lead_data, service)
+    except Exception as exc:
+        logger.warning("save_lead failed: %r — will still notify admins", exc)
 
-    # Notify admins FIRST (most important action)
-    notified = await _notify_admins(bot, lead_id, lead_data, service)
-    if not notified:
-        logger.error("ALL admin notifications failed for lead #%d", lead_id)
+    # Queue the admin alert before confirming to the user
+    queued = await _notify_admins(bot, lead_id, lead_data, service)
+    if not queued:
+        logger.error("Admin notification could not be queued for lead #%d", lead_id)
 
     # Confirmation to user
     if lead_id:
         try:
             svc_line = "🛃 Таможня · ЕАЭС" if service == "customs" else "🚚 Доставка груза"
             await msg.answer(
-                f"◈  <b>TE GROUP</b>\n\n"
-                f"  {_SEP}\n\n"
-                f"✅  <b>Заявка #{lead_id} принята</b>\n\n"
-                f"  {svc_line}\n\n"
-                f"  Менеджер рассчитает стоимость\n"
-                f"  и свяжется <b>в течение 1 часа</b>.\n\n"
-                f"  {_SEP}\n\n"
-                f"  Спасибо за обращение!",
+                _LEAD_ACCEPTED_TMPL.format(lead_id=lead_id, svc_line=svc_line),
                 reply_markup=after_submit_kb(),
             )
         except Exception:
@@ -332,17 +567,9 @@ async def _finish(msg: Message, state: FSMContext, bot: Bot) -> None:
             except Exception:
                 pass
     else:
-        # DB save failed but admins were notified
+        # No lead id (save failed or still pending) but the admin alert was queued
         try:
-            await msg.answer(
-                f"◈  <b>TE GROUP</b>\n\n"
-                f"  {_SEP}\n\n"
-                f"✅  <b>Заявка отправлена менеджеру</b>\n\n"
-                f"  Свяжемся <b>в течение 1 часа</b>.\n\n"
-                f"  {_SEP}\n\n"
-                f"  Спасибо за обращение!",
-                reply_markup=after_submit_kb(),
-            )
+            await msg.answer(_LEAD_SENT_TEXT, reply_markup=after_submit_kb())
         except Exception:
             try:
                 await msg.answer("✅ Заявка отправлена. Менеджер свяжется.", parse_mode=None)
@@ -350,25 +577,7 @@ async def _finish(msg: Message, state: FSMContext, bot: Bot) -> None:
                 pass
 
     await state.clear()
-    logger.info("Lead #%d done [%s] (admin_notified=%s)", lead_id, service, notified)
-
-
-def _resolve_weight(raw: str) -> float:
-    if raw in WEIGHT_TO_FLOAT:
-        return WEIGHT_TO_FLOAT[raw]
-    try:
-        return float(raw)
-    except (ValueError, TypeError):
-        return 0.0
-
-
-def _resolve_volume(raw: str) -> float:
-    if raw in VOLUME_TO_FLOAT:
-        return VOLUME_TO_FLOAT[raw]
-    try:
-        return float(raw)
-    except (ValueError, TypeError):
-        return 0.0
+    logger.info("Lead #%d done [%s] (admin_queued=%s)", lead_id, service, queued)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -388,46 +597,56 @@ _CUSTOMS_INTRO = (
     "📦 <b>Какой товар растаможить?</b>"
 )
 
+_QUESTION_INTRO = (
+    "◈  <b>TE GROUP</b>  ·  💬 Вопрос\n\n"
+    f"  {_SEP}\n\n"
+    "Опишите задачу или задайте вопрос —\n"
+    "менеджер ответит <b>в этом чате</b>."
+)
 
-@router.callback_query(OrderForm.service, F.data.startswith("service:"))
-async def pick_service(cb: CallbackQuery, state: FSMContext) -> None:
-    value = (cb.data or "").split(":")[1]
-    await state.update_data(service=value)
-
-    if value == "customs":
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _CUSTOMS_INTRO,
-                reply_markup=with_back(cargo_kb(), "back:service"),
-            )
-        except Exception as exc:
-            logger.warning("pick_service customs edit failed: %s", exc)
-        await state.set_state(OrderForm.customs_cargo)
+_QUESTION_DONE = (
+    "◈  <b>TE GROUP</b>\n\n"
+    f"  {_SEP}\n\n"
+    "✅  <b>Вопрос получен</b>\n\n"
+    "  Менеджер ответит в этом чате\n"
+    "  в ближайшее время.\n\n"
+    f"  {_SEP}\n\n"
+    "  Для оформления заявки — /start"
+)
 
-    elif value == "delivery":
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 0, "🌍 <b>Страна отправления?</b>"),
-                reply_markup=with_back(country_kb(), "back:service"),
-            )
-        except Exception as exc:
-            logger.warning("pick_service delivery edit failed: %s", exc)
-        await state.set_state(OrderForm.country)
 
-    elif value == "question":
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                "◈  <b>TE GROUP</b>  ·  💬 Вопрос\n\n"
-                f"  {_SEP}\n\n"
-                "Опишите задачу или задайте вопрос —\n"
-                "менеджер ответит <b>в этом чате</b>.",
-            )
-        except Exception as exc:
-            logger.warning("pick_service question edit failed: %s", exc)
-        await state.set_state(OrderForm.free_question)
+@router.callback_query(OrderForm.service, F.data.startswith("service:"))
+async def pick_service(cb: CallbackQuery, state: FSMContext) -> None:
+    async with _acked(cb):
+        value = (cb.data or "")[_SERVICE_PREFIX_LEN:]
+        data = await state.update_data(service=value)
 
-    await cb.answer()
+        if value == "customs":
+            try:
+                await cb.message.edit_text(  # type: ignore[union-attr]
+                    _CUSTOMS_INTRO,
+                    reply_markup=cargo_kb(_BACK_SERVICE),
+                )
+            except Exception as exc:
+                logger.warning("pick_service customs edit failed: %s", exc)
+            await state.set_state(OrderForm.customs_cargo)
+
+        elif value == "delivery":
+            try:
+                await cb.message.edit_text(  # type: ignore[union-attr]
+                    _card(data, 0, _PROMPT_D_COUNTRY),
+                    reply_markup=country_kb(_BACK_SERVICE),
+                )
+            except Exception as exc:
+                logger.warning("pick_service delivery edit failed: %s", exc)
+            await state.set_state(OrderForm.country)
+
+        elif value == "question":
+            try:
+                await cb.message.edit_text(_QUESTION_INTRO)  # type: ignore[union-attr]
+            except Exception as exc:
+                logger.warning("pick_service question edit failed: %s", exc)
+            await state.set_state(OrderForm.free_question)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -463,25 +682,17 @@ async def got_question(message: Message, state: FSMContext, bot: Bot) -> None:
 
     lead_id = 0
     try:
-        lead_id = await save_lead(lead_data)
-    except Exception:
-        logger.warning("Could not save question to DB")
+        lead_id = await _save_lead_bounded(bot, lead_data, "question")
+    except Exception as exc:
+        logger.warning("Could not save question to DB: %r", exc)
 
-    # Forward to admins — this is the most important step
-    notified = await _notify_admins(bot, lead_id, lead_data, "question")
-    if not notified:
-        logger.error("Question from user %s NOT delivered to any admin!",
+    # Queue the question for admins — this is the most important step
+    queued = await _notify_admins(bot, lead_id, lead_data, "question")
+    if not queued:
+        logger.error("Question from user %s could not be queued for admins!",
                       user.id if user else "?")
 
-    await message.answer(
-        "◈  <b>TE GROUP</b>\n\n"
-        f"  {_SEP}\n\n"
-        "✅  <b>Вопрос получен</b>\n\n"
-        "  Менеджер ответит в этом чате\n"
-        "  в ближайшее время.\n\n"
-        f"  {_SEP}\n\n"
-        "  Для оформления заявки — /start",
-    )
+    await message.answer(_QUESTION_DONE)
     await state.clear()
 
 
@@ -493,45 +704,24 @@ async def got_question(message: Message, state: FSMContext, bot: Bot) -> None:
 
 @router.callback_query(OrderForm.customs_cargo, F.data.startswith("cargo:"))
 async def c_cargo(cb: CallbackQuery, state: FSMContext) -> None:
-    await state.update_data(cargo_type=(cb.data or "").split(":")[1])
-    data = await state.get_data()
-    try:
-        await cb.message.edit_text(  # type: ignore[union-attr]
-            _card(data, 1, "🌍 <b>Откуда отправляется товар?</b>"),
-            reply_markup=with_back(country_kb(), "back:c_cargo_reset"),
-        )
-    except Exception as exc:
-        logger.warning("c_cargo edit failed: %s", exc)
-    await state.set_state(OrderForm.customs_country)
-    await cb.answer()
+    await _advance_cb(
+        cb, state, 1, _PROMPT_C_COUNTRY, country_kb(_BACK_C_CARGO),
+        OrderForm.customs_country, cargo_type=(cb.data or "")[_CARGO_PREFIX_LEN:],
+    )
 
 
 # ── C2. Country ──────────────────────────────────────────────
 
 @router.callback_query(OrderForm.customs_country, F.data.startswith("country:"))
 async def c_country(cb: CallbackQuery, state: FSMContext, bot: Bot) -> None:
-    value = (cb.data or "").split(":")[1]
+    value = (cb.data or "")[_COUNTRY_PREFIX_LEN:]
     if value == "other":
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 1, "🌍 <b>Введите название страны:</b>"),
-            )
-        except Exception:
-            pass
-        await cb.answer()
+        await _ask_typed(cb, state, 1, _PROMPT_COUNTRY_TEXT)
         return
-    await state.update_data(country=value)
-    data = await state.get_data()
-    try:
-        await cb.message.edit_text(  # type: ignore[union-attr]
-            _card(data, 2, "💰 <b>Примерная стоимость партии?</b>"),
-            reply_markup=with_back(invoice_kb(), "back:c_country_reset"),
-        )
-    except Exception as exc:
-        logger.warning("c_country edit failed: %s", exc)
-    await state.set_state(OrderForm.invoice_value)
-    await cb.answer()
+    await _advance_cb(
+        cb, state, 2, _PROMPT_INVOICE, invoice_kb(_BACK_C_COUNTRY),
+        OrderForm.invoice_value, country=value,
+    )
 
 
 @router.message(OrderForm.customs_country)
@@ -540,93 +730,54 @@ async def c_country_text(message: Message, state: FSMContext, bot: Bot) -> None:
     if len(country) < 2:
         await message.answer("Введите название страны.")
         return
-    await state.update_data(country=country)
-    data = await state.get_data()
-    mid = _card_id(data)
-    new_id = await _edit(
-        bot, message.chat.id, mid,
-        _card(data, 2, "💰 <b>Примерная стоимость партии?</b>"),
-        with_back(invoice_kb(), "back:c_country_reset"),
+    await _advance_text(
+        message, state, bot, 2, _PROMPT_INVOICE, invoice_kb(_BACK_C_COUNTRY),
+        OrderForm.invoice_value, country=country,
     )
-    await state.update_data(card_id=new_id)
-    await state.set_state(OrderForm.invoice_value)
 
 
 # ── C3. Invoice ──────────────────────────────────────────────
 
 @router.callback_query(OrderForm.invoice_value, F.data.startswith("invoice:"))
 async def c_invoice(cb: CallbackQuery, state: FSMContext) -> None:
-    value = (cb.data or "").split(":")[1]
+    value = (cb.data or "")[_INVOICE_PREFIX_LEN:]
     if value == "__custom__":
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 2, "💰 <b>Введите сумму в USD:</b>"),
-            )
-        except Exception:
-            pass
-        await cb.answer()
+        await _ask_typed(cb, state, 2, _PROMPT_INVOICE_TEXT)
         return
     num = INVOICE_TO_FLOAT.get(value, 0)
-    await state.update_data(invoice_value=value, invoice_value_num=num)
-    data = await state.get_data()
-    try:
-        await cb.message.edit_text(  # type: ignore[union-attr]
-            _card(data, 3, "⏰ <b>Насколько срочно?</b>"),
-            reply_markup=with_back(customs_urgency_kb(), "back:c_invoice_reset"),
-        )
-    except Exception as exc:
-        logger.warning("c_invoice edit failed: %s", exc)
-    await state.set_state(OrderForm.customs_urgency)
-    await cb.answer()
+    await _advance_cb(
+        cb, state, 3, _PROMPT_URGENCY, customs_urgency_kb(_BACK_C_INVOICE),
+        OrderForm.customs_urgency, invoice_value=value, invoice_value_num=num,
+    )
 
 
 @router.message(OrderForm.invoice_value)
 async def c_invoice_text(message: Message, state: FSMContext, bot: Bot) -> None:
     raw = (message.text or "").strip().replace("$", "").replace(",", "").replace(" ", "")
-    try:
-        num = float(raw)
-    except ValueError:
+    if not _NUM_RE.fullmatch(raw):
         await message.answer("Введите число (например: 5000).")
         return
-    await state.update_data(invoice_value=f"custom_{raw}", invoice_value_num=num)
-    data = await state.get_data()
-    mid = _card_id(data)
-    new_id = await _edit(
-        bot, message.chat.id, mid,
-        _card(data, 3, "⏰ <b>Насколько срочно?</b>"),
-        with_back(customs_urgency_kb(), "back:c_invoice_reset"),
+    num = float(raw)
+    await _advance_text(
+        message, state, bot, 3, _PROMPT_URGENCY, customs_urgency_kb(_BACK_C_INVOICE),
+        OrderForm.customs_urgency, invoice_value=f"custom_{raw}", invoice_value_num=num,
     )
-    await state.update_data(card_id=new_id)
-    await state.set_state(OrderForm.customs_urgency)
 
 
 # ── C4. Customs urgency ─────────────────────────────────────
 
 @router.callback_query(OrderForm.customs_urgency, F.data.startswith("curgency:"))
 async def c_urgency(cb: CallbackQuery, state: FSMContext, bot: Bot) -> None:
-    value = (cb.data or "").split(":")[1]
-    await state.update_data(customs_urgency=value)
-    data = await state.get_data()
-    mid = _card_id(data, cb)
-    try:
-        new_id = await _edit(
-            bot, cb.message.chat.id, mid,  # type: ignore[union-attr]
-            _card(data, 4, "📱 <b>Номер телефона для связи:</b>"),
-        )
-        await state.update_data(card_id=new_id)
-    except Exception as exc:
-        logger.warning("c_urgency edit failed: %s", exc)
-    try:
-        await bot.send_message(
-            cb.message.chat.id,  # type: ignore[union-attr]
-            "Нажмите кнопку или введите номер вручную 👇",
-            reply_markup=phone_kb(),
+    async with _acked(cb):
+        value = (cb.data or "")[_CURGENCY_PREFIX_LEN:]
+        data = await state.get_data()
+        data.update(customs_urgency=value)
+        text = _card(data, 4, _PROMPT_PHONE)
+        new_id = await _show_phone_step(
+            bot, cb.message.chat.id, _card_id(data, cb), text,  # type: ignore[union-attr]
         )
-    except Exception as exc:
-        logger.warning("c_urgency phone_kb failed: %s", exc)
-    await state.set_state(OrderForm.phone)
-    await cb.answer()
+        await state.update_data(customs_urgency=value, card_id=new_id)
+        await state.set_state(OrderForm.phone)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -637,28 +788,14 @@ async def c_urgency(cb: CallbackQuery, state: FSMContext, bot: Bot) -> None:
 
 @router.callback_query(OrderForm.country, F.data.startswith("country:"))
 async def d_country(cb: CallbackQuery, state: FSMContext) -> None:
-    value = (cb.data or "").split(":")[1]
+    value = (cb.data or "")[_COUNTRY_PREFIX_LEN:]
     if value == "other":
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 0, "🌍 <b>Введите название страны:</b>"),
-            )
-        except Exception:
-            pass
-        await cb.answer()
+        await _ask_typed(cb, state, 0, _PROMPT_COUNTRY_TEXT)
         return
-    await state.update_data(country=value)
-    data = await state.get_data()
-    try:
-        await cb.message.edit_text(  # type: ignore[union-attr]
-            _card(data, 1, "📍 <b>Город отправления?</b>"),
-            reply_markup=with_back(city_kb(value), "back:d_country_reset"),
-        )
-    except Exception as exc:
-        logger.warning("d_country edit failed: %s", exc)
-    await state.set_state(OrderForm.city)
-    await cb.answer()
+    await _advance_cb(
+        cb, state, 1, _PROMPT_CITY, city_kb(value, _BACK_D_COUNTRY),
+        OrderForm.city, country=value,
+    )
 
 
 @router.message(OrderForm.country)
@@ -667,49 +804,29 @@ async def d_country_text(message: Message, state: FSMContext, bot: Bot) -> None:
     if len(country) < 2:
         await message.answer("Введите название страны.")
         return
-    await state.update_data(country=country)
-    data = await state.get_data()
-    mid = _card_id(data)
-    new_id = await _edit(
-        bot, message.chat.id, mid,
-        _card(data, 1, "📍 <b>Введите город отправления:</b>"),
+    await _advance_text(
+        message, state, bot, 1, _PROMPT_CITY_ENTER, None,
+        OrderForm.city, country=country,
     )
-    await state.update_data(card_id=new_id)
-    await state.set_state(OrderForm.city)
 
 
 # ── D2. City ─────────────────────────────────────────────────
 
 @router.callback_query(OrderForm.city, F.data.startswith("city:"))
 async def d_city(cb: CallbackQuery, state: FSMContext) -> None:
-    parts = (cb.data or "").split(":", 2)
-    if len(parts) < 3:
+    _, sep, city_name = (cb.data or "")[_CITY_PREFIX_LEN:].partition(":")
+    if not sep:
         await cb.answer("Ошибка")
         return
-    city_name = parts[2]
-    data = await state.get_data()
 
     if city_name == "__custom__":
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 1, "📍 <b>Введите название города:</b>"),
-            )
-        except Exception:
-            pass
-        await cb.answer()
+        await _ask_typed(cb, state, 1, _PROMPT_CITY_TEXT)
         return
 
-    await state.update_data(city_from=city_name)
-    data = await state.get_data()
-    try:
-        await cb.message.edit_text(  # type: ignore[union-attr]
-            _card(data, 2, "📦 <b>Тип груза?</b>"),
-            reply_markup=with_back(cargo_kb(), "back:d_city_reset"),
-        )
-    except Exception as exc:
-        logger.warning("d_city edit failed: %s", exc)
-    await state.set_state(OrderForm.cargo_type)
-    await cb.answer()
+    await _advance_cb(
+        cb, state, 2, _PROMPT_CARGO, cargo_kb(_BACK_D_CITY),
+        OrderForm.cargo_type, city_from=city_name,
+    )
 
 
 @router.message(OrderForm.city)
@@ -718,157 +835,90 @@ async def d_city_text(message: Message, state: FSMContext, bot: Bot) -> None:
     if len(city) < 2:
         await message.answer("Введите город.")
         return
-    await state.update_data(city_from=city)
-    data = await state.get_data()
-    mid = _card_id(data)
-    new_id = await _edit(
-        bot, message.chat.id, mid,
-        _card(data, 2, "📦 <b>Тип груза?</b>"),
-        with_back(cargo_kb(), "back:d_city_reset"),
+    await _advance_text(
+        message, state, bot, 2, _PROMPT_CARGO, cargo_kb(_BACK_D_CITY),
+        OrderForm.cargo_type, city_from=city,
     )
-    await state.update_data(card_id=new_id)
-    await state.set_state(OrderForm.cargo_type)
 
 
 # ── D3. Cargo ────────────────────────────────────────────────
 
 @router.callback_query(OrderForm.cargo_type, F.data.startswith("cargo:"))
 async def d_cargo(cb: CallbackQuery, state: FSMContext) -> None:
-    await state.update_data(cargo_type=(cb.data or "").split(":")[1])
-    data = await state.get_data()
-    try:
-        await cb.message.edit_text(  # type: ignore[union-attr]
-            _card(data, 3, "⚖️ <b>Примерный вес?</b>"),
-            reply_markup=with_back(weight_kb(), "back:d_cargo_reset"),
-        )
-    except Exception as exc:
-        logger.warning("d_cargo edit failed: %s", exc)
-    await state.set_state(OrderForm.weight)
-    await cb.answer()
+    await _advance_cb(
+        cb, state, 3, _PROMPT_WEIGHT, weight_kb(_BACK_D_CARGO),
+        OrderForm.weight, cargo_type=(cb.data or "")[_CARGO_PREFIX_LEN:],
+    )
 
 
 # ── D4. Weight ───────────────────────────────────────────────
 
 @router.callback_query(OrderForm.weight, F.data.startswith("weight:"))
 async def d_weight(cb: CallbackQuery, state: FSMContext) -> None:
-    value = (cb.data or "").split(":")[1]
+    value = (cb.data or "")[_WEIGHT_PREFIX_LEN:]
     if value == "__custom__":
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 3, "⚖️ <b>Введите вес в кг:</b>"),
-            )
-        except Exception:
-            pass
-        await cb.answer()
+        await _ask_typed(cb, state, 3, _PROMPT_WEIGHT_TEXT)
         return
-    await state.update_data(weight_kg=value)
-    data = await state.get_data()
-    try:
-        await cb.message.edit_text(  # type: ignore[union-attr]
-            _card(data, 4, "📐 <b>Примерный объём?</b>"),
-            reply_markup=with_back(volume_kb(), "back:d_weight_reset"),
-        )
-    except Exception as exc:
-        logger.warning("d_weight edit failed: %s", exc)
-    await state.set_state(OrderForm.volume)
-    await cb.answer()
+    await _advance_cb(
+        cb, state, 4, _PROMPT_VOLUME, volume_kb(_BACK_D_WEIGHT),
+        OrderForm.volume, weight_kg=value, weight_kg_num=WEIGHT_TO_FLOAT.get(value, 0.0),
+    )
 
 
 @router.message(OrderForm.weight)
 async def d_weight_text(message: Message, state: FSMContext, bot: Bot) -> None:
     raw = (message.text or "").strip()
-    try:
-        float(raw)
-    except ValueError:
+    if not _NUM_RE.fullmatch(raw):
         await message.answer("Введите число (например: 500).")
         return
-    await state.update_data(weight_kg=raw)
-    data = await state.get_data()
-    mid = _card_id(data)
-    new_id = await _edit(
-        bot, message.chat.id, mid,
-        _card(data, 4, "📐 <b>Примерный объём?</b>"),
-        with_back(volume_kb(), "back:d_weight_reset"),
+    raw = raw.replace(",", ".")
+    await _advance_text(
+        message, state, bot, 4, _PROMPT_VOLUME, volume_kb(_BACK_D_WEIGHT),
+        OrderForm.volume, weight_kg=raw, weight_kg_num=float(raw),
     )
-    await state.update_data(card_id=new_id)
-    await state.set_state(OrderForm.volume)
 
 
 # ── D5. Volume ───────────────────────────────────────────────
 
 @router.callback_query(OrderForm.volume, F.data.startswith("volume:"))
 async def d_volume(cb: CallbackQuery, state: FSMContext) -> None:
-    value = (cb.data or "").split(":")[1]
+    value = (cb.data or "")[_VOLUME_PREFIX_LEN:]
     if value == "__custom__":
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 4, "📐 <b>Введите объём в м³:</b>"),
-            )
-        except Exception:
-            pass
-        await cb.answer()
+        await _ask_typed(cb, state, 4, _PROMPT_VOLUME_TEXT)
         return
-    await state.update_data(volume_m3=value)
-    data = await state.get_data()
-    try:
-        await cb.message.edit_text(  # type: ignore[union-attr]
-            _card(data, 5, "⏰ <b>Насколько срочно?</b>"),
-            reply_markup=with_back(urgency_kb(), "back:d_volume_reset"),
-        )
-    except Exception as exc:
-        logger.warning("d_volume edit failed: %s", exc)
-    await state.set_state(OrderForm.urgency)
-    await cb.answer()
+    await _advance_cb(
+        cb, state, 5, _PROMPT_URGENCY, urgency_kb(_BACK_D_VOLUME),
+        OrderForm.urgency, volume_m3=value, volume_m3_num=VOLUME_TO_FLOAT.get(value, 0.0),
+    )
 
 
 @router.message(OrderForm.volume)
 async def d_volume_text(message: Message, state: FSMContext, bot: Bot) -> None:
     raw = (message.text or "").strip()
-    try:
-        float(raw)
-    except ValueError:
+    if not _NUM_RE.fullmatch(raw):
         await message.answer("Введите число (например: 5).")
         return
-    await state.update_data(volume_m3=raw)
-    data = await state.get_data()
-    mid = _card_id(data)
-    new_id = await _edit(
-        bot, message.chat.id, mid,
-        _card(data, 5, "⏰ <b>Насколько срочно?</b>"),
-        with_back(urgency_kb(), "back:d_volume_reset"),
+    raw = raw.replace(",", ".")
+    await _advance_text(
+        message, state, bot, 5, _PROMPT_URGENCY, urgency_kb(_BACK_D_VOLUME),
+        OrderForm.urgency, volume_m3=raw, volume_m3_num=float(raw),
     )
-    await state.update_data(card_id=new_id)
-    await state.set_state(OrderForm.urgency)
 
 
 # ── D6. Urgency ──────────────────────────────────────────────
 
 @router.callback_query(OrderForm.urgency, F.data.startswith("urgency:"))
 async def d_urgency(cb: CallbackQuery, state: FSMContext, bot: Bot) -> None:
-    value = (cb.data or "").split(":")[1]
-    await state.update_data(urgency=value)
-    data = await state.get_data()
-    mid = _card_id(data, cb)
-    try:
-        new_id = await _edit(
-            bot, cb.message.chat.id, mid,  # type: ignore[union-attr]
-            _card(data, 6, "📱 <b>Номер телефона для связи:</b>"),
-        )
-        await state.update_data(card_id=new_id)
-    except Exception as exc:
-        logger.warning("d_urgency edit failed: %s", exc)
-    try:
-        await bot.send_message(
-            cb.message.chat.id,  # type: ignore[union-attr]
-            "Нажмите кнопку или введите номер вручную 👇",
-            reply_markup=phone_kb(),
+    async with _acked(cb):
+        value = (cb.data or "")[_URGENCY_PREFIX_LEN:]
+        data = await state.get_data()
+        data.update(urgency=value)
+        text = _card(data, 6, _PROMPT_PHONE)
+        new_id = await _show_phone_step(
+            bot, cb.message.chat.id, _card_id(data, cb), text,  # type: ignore[union-attr]
         )
-    except Exception as exc:
-        logger.warning("d_urgency phone_kb failed: %s", exc)
-    await state.set_state(OrderForm.phone)
-    await cb.answer()
+        await state.update_data(urgency=value, card_id=new_id)
+        await state.set_state(OrderForm.phone)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -880,15 +930,11 @@ async def got_phone_contact(message: Message, state: FSMContext) -> None:
     phone = message.contact.phone_number  # type: ignore[union-attr]
     await state.update_data(phone=phone)
     try:
-        await message.answer("✅ Принято!", reply_markup=ReplyKeyboardRemove())
+        await message.answer("✅ Принято!", reply_markup=remove_kb())
     except Exception:
         pass
     try:
-        await message.answer(
-            "💬 <b>Комментарий к заявке?</b>\n\n"
-            "<i>Напишите текст или нажмите «Пропустить»</i>",
-            reply_markup=skip_comment_kb(),
-        )
+        await message.answer(_PROMPT_COMMENT, reply_markup=skip_comment_kb())
     except Exception as exc:
         logger.error("got_phone_contact comment prompt failed: %s", exc)
     await state.set_state(OrderForm.comment)
@@ -897,8 +943,8 @@ async def got_phone_contact(message: Message, state: FSMContext) -> None:
 @router.message(OrderForm.phone)
 async def got_phone_text(message: Message, state: FSMContext) -> None:
     phone = (message.text or "").strip()
-    clean = phone.replace(" ", "").replace("-", "").replace("(", "").replace(")", "")
-    if len(clean) < 6 or not any(c.isdigit() for c in clean):
+    clean = phone.translate(_PHONE_STRIP)
+    if len(clean) < 6 or not clean.lstrip("+").isdecimal():
         await message.answer(
             "📱 Введите корректный номер телефона.\n"
             "Например: +7 999 123 45 67",
@@ -906,212 +952,178 @@ async def got_phone_text(message: Message, state: FSMContext) -> None:
         return
     await state.update_data(phone=phone)
     try:
-        await message.answer("✅ Принято!", reply_markup=ReplyKeyboardRemove())
+        await message.answer("✅ Принято!", reply_markup=remove_kb())
     except Exception:
         pass
     try:
-        await message.answer(
-            "💬 <b>Комментарий к заявке?</b>\n\n"
-            "<i>Напишите текст или нажмите «Пропустить»</i>",
-            reply_markup=skip_comment_kb(),
-        )
+        await message.answer(_PROMPT_COMMENT, reply_markup=skip_comment_kb())
     except Exception as exc:
         logger.error("got_phone_text comment prompt failed: %s", exc)
     await state.set_state(OrderForm.comment)
 
 
-@router.callback_query(OrderForm.comment, F.data == "skip_comment")
+@router.callback_query(OrderForm.comment, F.data == CB_SKIP_COMMENT)
 async def skip_comment(cb: CallbackQuery, state: FSMContext, bot: Bot) -> None:
-    await state.update_data(comment="")
-    await cb.message.edit_reply_markup(reply_markup=None)  # type: ignore[union-attr]
-    await _finish(cb.message, state, bot)  # type: ignore[arg-type]
-    await cb.answer()
+    async with _acked(cb):
+        data = await state.update_data(comment="")
+        await cb.message.edit_reply_markup(reply_markup=None)  # type: ignore[union-attr]
+        await _finish(cb.message, state, bot, data)  # type: ignore[arg-type]
 
 
 @router.message(OrderForm.comment)
 async def got_comment(message: Message, state: FSMContext, bot: Bot) -> None:
-    await state.update_data(comment=(message.text or "").strip())
-    await _finish(message, state, bot)
+    data = await state.update_data(comment=(message.text or "").strip())
+    await _finish(message, state, bot, data)
 
 
 # ═══════════════════════════════════════════════════════════════
 # BACK NAVIGATION
 # ═══════════════════════════════════════════════════════════════
 
-@router.callback_query(F.data.startswith("back:"))
-async def handle_back(cb: CallbackQuery, state: FSMContext) -> None:
-    target = (cb.data or "").split(":", 1)[1]
-    data = await state.get_data()
-    new_state = None
+# target → (fields to reset, card renderer, keyboard factory, state to restore)
+_BackRoute = tuple[
+    dict[str, Any],
+    Callable[[dict], str],
+    Callable[[dict], InlineKeyboardMarkup],
+    State,
+]
 
+_BACK_ROUTES: dict[str, _BackRoute] = {
     # ── Back to welcome ──────────────────────────────────────
-    if target == "service":
-        try:
-            await cb.message.edit_text(WELCOME_TEXT, reply_markup=service_kb())  # type: ignore[union-attr]
-        except Exception as exc:
-            logger.warning("back:service edit failed: %s", exc)
-        new_state = OrderForm.service
-
+    "service": (
+        {},
+        lambda d: WELCOME_TEXT,
+        lambda d: service_kb(),
+        OrderForm.service,
+    ),
     # ── CUSTOMS back ─────────────────────────────────────────
-    elif target == "c_cargo_reset":
-        await state.update_data(cargo_type="")
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _CUSTOMS_INTRO, reply_markup=with_back(cargo_kb(), "back:service"),
-            )
-        except Exception as exc:
-            logger.warning("back:c_cargo edit failed: %s", exc)
-        new_state = OrderForm.customs_cargo
-
-    elif target == "c_country_reset":
-        await state.update_data(country="")
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 1, "🌍 <b>Откуда отправляется товар?</b>"),
-                reply_markup=with_back(country_kb(), "back:c_cargo_reset"),
-            )
-        except Exception as exc:
-            logger.warning("back:c_country edit failed: %s", exc)
-        new_state = OrderForm.customs_country
-
-    elif target == "c_invoice_reset":
-        await state.update_data(invoice_value="", invoice_value_num=0)
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 2, "💰 <b>Примерная стоимость партии?</b>"),
-                reply_markup=with_back(invoice_kb(), "back:c_country_reset"),
-            )
-        except Exception as exc:
-            logger.warning("back:c_invoice edit failed: %s", exc)
-        new_state = OrderForm.invoice_value
-
+    "c_cargo_reset": (
+        {"cargo_type": ""},
+        lambda d: _CUSTOMS_INTRO,
+        lambda d: cargo_kb(_BACK_SERVICE),
+        OrderForm.customs_cargo,
+    ),
+    "c_country_reset": (
+        {"country": ""},
+        lambda d: _card(d, 1, _PROMPT_C_COUNTRY),
+        lambda d: country_kb(_BACK_C_CARGO),
+        OrderForm.customs_country,
+    ),
+    "c_invoice_reset": (
+        {"invoice_value": "", "invoice_value_num": 0},
+        lambda d: _card(d, 2, _PROMPT_INVOICE),
+        lambda d: invoice_kb(_BACK_C_COUNTRY),
+        OrderForm.invoice_value,
+    ),
     # ── DELIVERY back ────────────────────────────────────────
-    elif target == "d_country_reset":
-        await state.update_data(country="")
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 0, "🌍 <b>Страна отправления?</b>"),
-                reply_markup=with_back(country_kb(), "back:service"),
-            )
-        except Exception as exc:
-            logger.warning("back:d_country edit failed: %s", exc)
-        new_state = OrderForm.country
+    "d_country_reset": (
+        {"country": ""},
+        lambda d: _card(d, 0, _PROMPT_D_COUNTRY),
+        lambda d: country_kb(_BACK_SERVICE),
+        OrderForm.country,
+    ),
+    "d_city_reset": (
+        {"city_from": ""},
+        lambda d: _card(d, 1, _PROMPT_CITY),
+        lambda d: city_kb(d.get("country", ""), _BACK_D_COUNTRY),
+        OrderForm.city,
+    ),
+    "d_cargo_reset": (
+        {"cargo_type": ""},
+        lambda d: _card(d, 2, _PROMPT_CARGO),
+        lambda d: cargo_kb(_BACK_D_CITY),
+        OrderForm.cargo_type,
+    ),
+    "d_weight_reset": (
+        {"weight_kg": "", "weight_kg_num": 0},
+        lambda d: _card(d, 3, _PROMPT_WEIGHT),
+        lambda d: weight_kb(_BACK_D_CARGO),
+        OrderForm.weight,
+    ),
+    "d_volume_reset": (
+        {"volume_m3": "", "volume_m3_num": 0},
+        lambda d: _card(d, 4, _PROMPT_VOLUME),
+        lambda d: volume_kb(_BACK_D_WEIGHT),
+        OrderForm.volume,
+    ),
+    "d_urgency_reset": (
+        {"urgency": ""},
+        lambda d: _card(d, 5, _PROMPT_URGENCY),
+        lambda d: urgency_kb(_BACK_D_VOLUME),
+        OrderForm.urgency,
+    ),
+}
 
-    elif target == "d_city_reset":
-        await state.update_data(city_from="")
-        data = await state.get_data()
-        country = data.get("country", "")
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 1, "📍 <b>Город отправления?</b>"),
-                reply_markup=with_back(city_kb(country), "back:d_country_reset"),
-            )
-        except Exception as exc:
-            logger.warning("back:d_city edit failed: %s", exc)
-        new_state = OrderForm.city
-
-    elif target == "d_cargo_reset":
-        await state.update_data(cargo_type="")
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 2, "📦 <b>Тип груза?</b>"),
-                reply_markup=with_back(cargo_kb(), "back:d_city_reset"),
-            )
-        except Exception as exc:
-            logger.warning("back:d_cargo edit failed: %s", exc)
-        new_state = OrderForm.cargo_type
-
-    elif target == "d_weight_reset":
-        await state.update_data(weight_kg="")
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 3, "⚖️ <b>Примерный вес?</b>"),
-                reply_markup=with_back(weight_kb(), "back:d_cargo_reset"),
-            )
-        except Exception as exc:
-            logger.warning("back:d_weight edit failed: %s", exc)
-        new_state = OrderForm.weight
-
-    elif target == "d_volume_reset":
-        await state.update_data(volume_m3="")
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 4, "📐 <b>Примерный объём?</b>"),
-                reply_markup=with_back(volume_kb(), "back:d_weight_reset"),
-            )
-        except Exception as exc:
-            logger.warning("back:d_volume edit failed: %s", exc)
-        new_state = OrderForm.volume
 
-    elif target == "d_urgency_reset":
-        await state.update_data(urgency="")
-        data = await state.get_data()
-        try:
-            await cb.message.edit_text(  # type: ignore[union-attr]
-                _card(data, 5, "⏰ <b>Насколько срочно?</b>"),
-                reply_markup=with_back(urgency_kb(), "back:d_volume_reset"),
-            )
-        except Exception as exc:
-            logger.warning("back:d_urgency edit failed: %s", exc)
-        new_state = OrderForm.urgency
-
-    if new_state:
-        await state.set_state(new_state)
-    await cb.answer()
+@router.callback_query(F.data.startswith("back:"))
+async def handle_back(cb: CallbackQuery, state: FSMContext) -> None:
+    async with _acked(cb):
+        target = (cb.data or "")[_BACK_PREFIX_LEN:]
+        route = _BACK_ROUTES.get(target)
+        if route:
+            reset, render, kb, new_state = route
+            data = await state.update_data(reset) if reset else await state.get_data()
+            # Commit the state first so a tap arriving while the edit is in
+            # flight already sees the step it is looking at.
+            await state.set_state(new_state)
+            text, markup = render(data), kb(data)
+            msg = cb.message
+            # Repeated taps land on the card already shown — skip the edit
+            # Telegram would reject as "message is not modified".
+            if not (
+                isinstance(msg, Message)
+                and msg.reply_markup == markup
+                and msg.html_text == text
+            ):
+                try:
+                    await msg.edit_text(text, reply_markup=markup)  # type: ignore[union-attr]
+                except Exception as exc:
+                    logger.warning("back:%s edit failed: %s", target, exc)
 
 
 # ═══════════════════════════════════════════════════════════════
 # POST-SUBMIT ACTIONS
 # ═══════════════════════════════════════════════════════════════
 
-@router.callback_query(F.data == "action:restart")
+@router.callback_query(F.data == CB_ACTION_RESTART)
 async def action_restart(cb: CallbackQuery, state: FSMContext) -> None:
-    await cb.message.edit_reply_markup(reply_markup=None)  # type: ignore[union-attr]
-    msg = await cb.message.answer(WELCOME_TEXT, reply_markup=service_kb())  # type: ignore[union-attr]
-    user = cb.from_user
-    await state.clear()
-    await state.update_data(
-        card_id=msg.message_id,
-        _uid=user.id if user else 0,
-        _uname=getattr(user, "username", "") or "",
-        _ufull=getattr(user, "full_name", "") or "",
-    )
-    await state.set_state(OrderForm.service)
-    await cb.answer()
+    async with _acked(cb):
+        # Stripping the old buttons and sending the welcome are independent —
+        # overlap them, but settle the strip before the funnel is reset.
+        # (ensure_future: gather() hashes its arguments, aiogram methods aren't hashable)
+        stripped, msg = await asyncio.gather(
+            asyncio.ensure_future(cb.message.edit_reply_markup(reply_markup=None)),  # type: ignore[union-attr]
+            asyncio.ensure_future(cb.message.answer(WELCOME_TEXT, reply_markup=service_kb())),  # type: ignore[union-attr]
+            return_exceptions=True,
+        )
+        if isinstance(stripped, Exception):
+            logger.warning("action_restart edit failed: %s", stripped)
+        if isinstance(msg, BaseException):
+            raise msg
+        user = cb.from_user
+        # Replacing the data wholesale is what clear() + update_data() did,
+        # in one storage write instead of three.
+        await state.set_data({
+            "card_id": msg.message_id,
+            "_uid": user.id if user else 0,
+            "_uname": getattr(user, "username", "") or "",
+            "_ufull": getattr(user, "full_name", "") or "",
+        })
+        await state.set_state(OrderForm.service)
+
+
+_ACTION_TEXT: dict[str, str] = {
+    CB_ACTION_CALL: "📞 Менеджер перезвонит вам в ближайшее время.",
+}
+_ACTION_DEFAULT_TEXT = "Менеджер свяжется с вами."
+# The replies are static — let the Telegram client answer repeat taps itself
+_ACTION_CACHE_TIME = 30
 
 
 @router.callback_query(F.data.startswith("action:"))
 async def action_misc(cb: CallbackQuery) -> None:
-    action = (cb.data or "").split(":")[1]
-    texts = {
-        "call": "📞 Менеджер перезвонит вам в ближайшее время.",
-    }
-    await cb.answer(texts.get(action, "Менеджер свяжется с вами."), show_alert=True)
-
-
-# ── Admin inline buttons ─────────────────────────────────────
-
-@router.callback_query(F.data.startswith("adm:"))
-async def admin_action(cb: CallbackQuery) -> None:
-    parts = (cb.data or "").split(":")
-    if len(parts) < 3:
-        await cb.answer()
-        return
-    action, lead_id_str = parts[1], parts[2]
-    if action == "progress":
-        from bot.db import update_lead_status
-        await update_lead_status(int(lead_id_str), "IN_PROGRESS")
-        await cb.answer(f"✅ Лид #{lead_id_str} → В РАБОТЕ")
-    elif action == "call":
-        from bot.db import get_lead
-        lead = await get_lead(int(lead_id_str))
-        phone = lead.get("phone", "—") if lead else "—"
-        await cb.answer(f"📞 {phone}", show_alert=True)
-    else:
-        await cb.answer()
+    await cb.answer(
+        _ACTION_TEXT.get(cb.data or "", _ACTION_DEFAULT_TEXT),
+        show_alert=True,
+        cache_time=_ACTION_CACHE_TIME,
+    )
@@ -2,14 +2,27 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from aiogram.types import (
     InlineKeyboardButton,
     InlineKeyboardMarkup,
     KeyboardButton,
     ReplyKeyboardMarkup,
+    ReplyKeyboardRemove,
 )
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+# ═══════════════════════════════════════════════════════════════
+# CALLBACK DATA
+# ═══════════════════════════════════════════════════════════════
+
+# Fixed callback payloads matched by `F.data == ...` filters
+CB_SKIP_COMMENT = "skip_comment"
+CB_ACTION_CALL = "action:call"
+CB_ACTION_RESTART = "action:restart"
+
+
 # ═══════════════════════════════════════════════════════════════
 # LABEL DICTIONARIES
 # ═══════════════════════════════════════════════════════════════
@@ -145,12 +158,27 @@ DEFAULT_DELIVERY: dict[str, str] = {
     "express": "⚡ Экспресс — 7–12 дней",
     "urgent": "✈️ Авиа — 3–6 дней",
 }
+# (country, urgency) → info, flattened once for single-probe lookups
+DELIVERY_INFO_FLAT: dict[tuple[str, str], str] = {
+    (country, urg): info
+    for country, by_urg in DELIVERY_INFO.items()
+    for urg, info in by_urg.items()
+}
 
 
 # ═══════════════════════════════════════════════════════════════
 # KEYBOARD BUILDERS
 # ═══════════════════════════════════════════════════════════════
+# Markups are frozen pydantic models, so static ones are built once
+# and the same object is reused on every send.
+
+def _add_back(b: InlineKeyboardBuilder, back_cb: str | None) -> None:
+    """Append a ← Назад row to the keyboard being built."""
+    if back_cb:
+        b.row(InlineKeyboardButton(text="← Назад", callback_data=back_cb))
 
+
+@lru_cache(maxsize=None)
 def service_kb() -> InlineKeyboardMarkup:
     b = InlineKeyboardBuilder()
     for label, val in SERVICE_OPTIONS:
@@ -159,15 +187,18 @@ def service_kb() -> InlineKeyboardMarkup:
     return b.as_markup()
 
 
-def country_kb() -> InlineKeyboardMarkup:
+@lru_cache(maxsize=None)
+def country_kb(back_cb: str | None = None) -> InlineKeyboardMarkup:
     b = InlineKeyboardBuilder()
     for label, val in COUNTRIES:
         b.button(text=label, callback_data=f"country:{val}")
     b.adjust(2, 2, 1)
+    _add_back(b, back_cb)
     return b.as_markup()
 
 
-def city_kb(country: str) -> InlineKeyboardMarkup:
+@lru_cache(maxsize=64)
+def city_kb(country: str, back_cb: str | None = None) -> InlineKeyboardMarkup:
     b = InlineKeyboardBuilder()
     cities = CITIES_BY_COUNTRY.get(country, [])
     for city in cities:
@@ -175,60 +206,74 @@ def city_kb(country: str) -> InlineKeyboardMarkup:
     b.button(text="✏️ Другой город", callback_data=f"city:{country}:__custom__")
     cols = 3 if len(cities) >= 6 else 2
     b.adjust(cols)
+    _add_back(b, back_cb)
     return b.as_markup()
 
 
-def cargo_kb() -> InlineKeyboardMarkup:
+@lru_cache(maxsize=None)
+def cargo_kb(back_cb: str | None = None) -> InlineKeyboardMarkup:
     b = InlineKeyboardBuilder()
     for label, val in CARGO_TYPES:
         b.button(text=label, callback_data=f"cargo:{val}")
     b.adjust(2)
+    _add_back(b, back_cb)
     return b.as_markup()
 
 
-def weight_kb() -> InlineKeyboardMarkup:
+@lru_cache(maxsize=None)
+def weight_kb(back_cb: str | None = None) -> InlineKeyboardMarkup:
     b = InlineKeyboardBuilder()
     for label, val in WEIGHT_PRESETS:
         b.button(text=label, callback_data=f"weight:{val}")
     b.button(text="✏️ Ввести точно", callback_data="weight:__custom__")
     b.adjust(2, 2, 2, 1)
+    _add_back(b, back_cb)
     return b.as_markup()
 
 
-def volume_kb() -> InlineKeyboardMarkup:
+@lru_cache(maxsize=None)
+def volume_kb(back_cb: str | None = None) -> InlineKeyboardMarkup:
     b = InlineKeyboardBuilder()
     for label, val in VOLUME_PRESETS:
         b.button(text=label, callback_data=f"volume:{val}")
     b.button(text="✏️ Ввести точно", callback_data="volume:__custom__")
     b.adjust(2, 2, 2, 1)
+    _add_back(b, back_cb)
     return b.as_markup()
 
 
-def urgency_kb() -> InlineKeyboardMarkup:
+@lru_cache(maxsize=None)
+def urgency_kb(back_cb: str | None = None) -> InlineKeyboardMarkup:
     b = InlineKeyboardBuilder()
     for label, val in URGENCY_OPTIONS:
         b.button(text=label, callback_data=f"urgency:{val}")
     b.adjust(1)
+    _add_back(b, back_cb)
     return b.as_markup()
 
 
-def invoice_kb() -> InlineKeyboardMarkup:
+@lru_cache(maxsize=None)
+def invoice_kb(back_cb: str | None = None) -> InlineKeyboardMarkup:
     b = InlineKeyboardBuilder()
     for label, val in INVOICE_PRESETS:
         b.button(text=label, callback_data=f"invoice:{val}")
     b.button(text="✏️ Ввести сумму", callback_data="invoice:__custom__")
     b.adjust(2, 2, 2, 1)
+    _add_back(b, back_cb)
     return b.as_markup()
 
 
-def customs_urgency_kb() -> InlineKeyboardMarkup:
+@lru_cache(maxsize=None)
+def customs_urgency_kb(back_cb: str | None = None) -> InlineKeyboardMarkup:
     b = InlineKeyboardBuilder()
     for label, val in CUSTOMS_URGENCY_OPTIONS:
         b.button(text=label, callback_data=f"curgency:{val}")
     b.adjust(1)
+    _add_back(b, back_cb)
     return b.as_markup()
 
 
+@lru_cache(maxsize=None)
 def phone_kb() -> ReplyKeyboardMarkup:
     return ReplyKeyboardMarkup(
         keyboard=[[KeyboardButton(text="📲 Отправить номер", request_contact=True)]],
@@ -237,19 +282,26 @@ def phone_kb() -> ReplyKeyboardMarkup:
     )
 
 
+@lru_cache(maxsize=None)
+def remove_kb() -> ReplyKeyboardRemove:
+    return ReplyKeyboardRemove()
+
+
+@lru_cache(maxsize=None)
 def skip_comment_kb() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         inline_keyboard=[
-            [InlineKeyboardButton(text="⏭ Пропустить", callback_data="skip_comment")],
+            [InlineKeyboardButton(text="⏭ Пропустить", callback_data=CB_SKIP_COMMENT)],
         ],
     )
 
 
+@lru_cache(maxsize=None)
 def after_submit_kb() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         inline_keyboard=[
-            [InlineKeyboardButton(text="📞 Позвоните мне", callback_data="action:call")],
-            [InlineKeyboardButton(text="🔄 Новая заявка", callback_data="action:restart")],
+            [InlineKeyboardButton(text="📞 Позвоните мне", callback_data=CB_ACTION_CALL)],
+            [InlineKeyboardButton(text="🔄 Новая заявка", callback_data=CB_ACTION_RESTART)],
         ],
     )
 
@@ -261,14 +313,3 @@ def admin_lead_kb(lead_id: int) -> InlineKeyboardMarkup:
             InlineKeyboardButton(text="📞 Тел.", callback_data=f"adm:call:{lead_id}"),
         ]],
     )
-
-
-def back_btn(cb_data: str) -> list[list[InlineKeyboardButton]]:
-    """Return a single-row back-button list ready to append to inline_keyboard."""
-    return [[InlineKeyboardButton(text="← Назад", callback_data=cb_data)]]
-
-
-def with_back(kb: InlineKeyboardMarkup, back_cb: str) -> InlineKeyboardMarkup:
-    """Append a ← Назад button to any inline keyboard."""
-    rows = list(kb.inline_keyboard) + back_btn(back_cb)
-    return InlineKeyboardMarkup(inline_keyboard=rows)
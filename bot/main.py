@@ -1,12 +1,15 @@
 """TE GROUP Telegram Bot — entry point.
 
 Resilience features:
-1. Auto-restart polling on crash (up to 100 retries with backoff).
+1. Auto-restart polling on crash (up to 100 consecutive retries,
+   exponential backoff with jitter).
 2. Keepalive pinger prevents Render free-tier spin-down.
 3. Periodic DB health check with auto-reconnect.
 4. Bot starts even if the database is unreachable.
 5. Bot description / short description set on every start for branding.
 6. Health-check HTTP server for Render.
+7. Admin notifications go through a queue that honours flood control.
+8. FSM sessions live in bounded memory — idle ones expire after a day.
 """
 
 from __future__ import annotations
@@ -14,30 +17,51 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import queue
+import random
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
-from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.types import BotCommand
 
 from bot.config import settings
 from bot.db import close_db, init_db
 from bot.handlers import admin, common, funnel
 from bot.handlers.common import fallback_router
-from bot.middleware import AntiSpamMiddleware
+from bot.middleware import AntiSpamMiddleware, CallbackDedupMiddleware
+from bot.notify import drain as drain_notify_queue
+from bot.notify import start_workers as start_notify_workers
+from bot.storage import BoundedMemoryStorage
 
 
-def _setup_logging() -> None:
+# Longest shutdown waits for queued admin alerts to go out
+_NOTIFY_DRAIN_TIMEOUT = 15
+
+
+def _setup_logging() -> QueueListener:
+    """Route log records through a queue so stdout writes and timestamp
+    formatting happen in a listener thread, not on the event loop."""
     fmt = logging.Formatter(
         "%(asctime)s  %(levelname)-8s  %(name)s  %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(fmt)
-    logging.root.handlers = [handler]
+    # Records are still built on the loop; the format above never shows
+    # thread/process info, so skip collecting it for every record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler)
+    logging.root.handlers = [QueueHandler(log_queue)]
     logging.root.setLevel(settings.LOG_LEVEL)
+    listener.start()
+    return listener
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -86,15 +110,16 @@ async def _keepalive_pinger() -> None:
 
     logger.info("Keepalive → %s (every 4 min)", url)
 
-    while True:
-        await asyncio.sleep(240)          # 4 minutes
-        try:
-            timeout = aiohttp.ClientTimeout(total=15)
-            async with aiohttp.ClientSession(timeout=timeout) as sess:
+    # One session for the life of the loop, not a new one per ping
+    timeout = aiohttp.ClientTimeout(total=15)
+    async with aiohttp.ClientSession(timeout=timeout) as sess:
+        while True:
+            await asyncio.sleep(240)          # 4 minutes
+            try:
                 async with sess.get(url) as resp:
                     logger.debug("keepalive ping: %d", resp.status)
-        except Exception as exc:
-            logger.warning("keepalive ping failed: %s", exc)
+            except Exception as exc:
+                logger.warning("keepalive ping failed: %s", exc)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -117,8 +142,9 @@ async def _db_health_loop() -> None:
             # init_db / _retry_connect is probably already handling this
             continue
         try:
-            async with db_mod.pool.acquire(timeout=5) as conn:
-                await conn.fetchval("SELECT 1")
+            # One deadline over acquire + query; asyncpg keeps the prepared
+            # "SELECT 1" in each connection's statement cache.
+            await asyncio.wait_for(db_mod.pool.fetchval("SELECT 1"), 5)
         except Exception as exc:
             logger.error("DB health check failed: %s — reconnecting", exc)
             try:
@@ -160,79 +186,97 @@ async def _set_bot_branding(bot: Bot) -> None:
 # ═══════════════════════════════════════════════════════════════
 
 async def main() -> None:
-    _setup_logging()
-    logger = logging.getLogger("bot")
-    logger.info("Starting TE GROUP Bot")
-
-    # Database — non-fatal
+    log_listener = _setup_logging()
     try:
-        await init_db()
-    except Exception as exc:
-        logger.error("init_db raised: %s — bot will start without DB", exc)
-
-    bot = Bot(
-        token=settings.BOT_TOKEN,
-        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
-    )
+        logger = logging.getLogger("bot")
+        logger.info("Starting TE GROUP Bot")
 
-    # Commands & branding
-    await bot.set_my_commands([
-        BotCommand(command="start", description="📦 Новая заявка"),
-        BotCommand(command="help", description="ℹ️ Помощь"),
-    ])
-    await _set_bot_branding(bot)
-
-    dp = Dispatcher(storage=MemoryStorage())
-    dp.message.middleware(AntiSpamMiddleware())
-
-    # Router order matters: common first, then admin, then funnel, fallback last.
-    dp.include_router(common.router)
-    dp.include_router(admin.router)
-    dp.include_router(funnel.router)
-    dp.include_router(fallback_router)
-
-    # Health server for Render
-    await _start_health_server()
-    logger.info("Health server on :%s", os.environ.get("PORT", "10000"))
-
-    # Background keepalive — prevents Render free-tier from spinning down
-    asyncio.create_task(_keepalive_pinger())
-
-    # Background DB health monitor
-    asyncio.create_task(_db_health_loop())
-
-    # ── Polling with auto-restart ─────────────────────────────
-    MAX_RETRIES = 100
-    for attempt in range(1, MAX_RETRIES + 1):
+        # Database — non-fatal
         try:
-            await bot.delete_webhook(drop_pending_updates=False)
-            logger.info("Polling started (attempt #%d)", attempt)
-            await dp.start_polling(
-                bot,
-                polling_timeout=30,      # seconds between getUpdates
-                handle_signals=False,     # we handle lifecycle ourselves
-            )
-            # If start_polling returns cleanly → normal shutdown
-            logger.info("Polling stopped cleanly")
-            break
-
+            await init_db()
         except Exception as exc:
-            logger.error(
-                "Polling crashed (attempt #%d/%d): %s",
-                attempt, MAX_RETRIES, exc,
-                exc_info=True,
-            )
-            if attempt < MAX_RETRIES:
-                wait = min(attempt * 5, 60)   # 5s → 10s → … → cap at 60s
-                logger.info("Restarting polling in %ds…", wait)
-                await asyncio.sleep(wait)
-            else:
-                logger.critical("Max retries (%d) reached — exiting", MAX_RETRIES)
-
-    # Cleanup
-    await close_db()
-    await bot.session.close()
-    logger.info("Bot stopped")
+            logger.error("init_db raised: %s — bot will start without DB", exc)
+
+        bot = Bot(
+            token=settings.BOT_TOKEN,
+            default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+        )
+
+        # Commands & branding
+        await bot.set_my_commands([
+            BotCommand(command="start", description="📦 Новая заявка"),
+            BotCommand(command="help", description="ℹ️ Помощь"),
+        ])
+        await _set_bot_branding(bot)
+
+        dp = Dispatcher(storage=BoundedMemoryStorage())
+        dp.message.middleware(AntiSpamMiddleware())
+        dp.callback_query.middleware(CallbackDedupMiddleware())
+
+        # Router order matters: common first, then admin, then funnel, fallback last.
+        dp.include_router(common.router)
+        dp.include_router(admin.router)
+        dp.include_router(funnel.router)
+        dp.include_router(fallback_router)
+
+        # Health server for Render
+        await _start_health_server()
+        logger.info("Health server on :%s", os.environ.get("PORT", "10000"))
+
+        # Background keepalive — prevents Render free-tier from spinning down
+        asyncio.create_task(_keepalive_pinger())
+
+        # Background DB health monitor
+        asyncio.create_task(_db_health_loop())
+
+        # Admin notification senders
+        start_notify_workers(bot)
+
+        # ── Polling with auto-restart ─────────────────────────────
+        MAX_RETRIES = 100
+        STABLE_RUN = 60   # a crash after this many seconds of polling starts a fresh count
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.monotonic()
+            try:
+                await bot.delete_webhook(drop_pending_updates=False)
+                logger.info("Polling started (attempt #%d)", attempt)
+                await dp.start_polling(
+                    bot,
+                    polling_timeout=30,      # seconds between getUpdates
+                    handle_signals=False,     # we handle lifecycle ourselves
+                )
+                # If start_polling returns cleanly → normal shutdown
+                logger.info("Polling stopped cleanly")
+                break
+
+            except Exception as exc:
+                if time.monotonic() - started > STABLE_RUN:
+                    attempt = 1
+                logger.error(
+                    "Polling crashed (attempt #%d/%d): %s",
+                    attempt, MAX_RETRIES, exc,
+                    exc_info=True,
+                )
+                if attempt < MAX_RETRIES:
+                    # 2s → 4s → … → cap at 60s, jittered ×0.5–1.5 so restarts
+                    # don't phase-lock against a recovering API
+                    wait = min(2 ** min(attempt, 6), 60) * (0.5 + random.random())
+                    logger.info("Restarting polling in %.0fs…", wait)
+                    await asyncio.sleep(wait)
+                else:
+                    logger.critical("Max retries (%d) reached — exiting", MAX_RETRIES)
+                    break
+
+        # Cleanup — send queued admin alerts before the session goes away
+        await drain_notify_queue(_NOTIFY_DRAIN_TIMEOUT)
+        await close_db()
+        await bot.session.close()
+        logger.info("Bot stopped")
+    finally:
+        # The listener thread is a daemon — flush queued records on any exit
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -3,17 +3,22 @@
 Commands (messages starting with /) and contact shares always pass through.
 Short messages (< 30 chars) skip dedup — they are likely form inputs
 (phone numbers, city names, weights, etc.) that users may need to re-enter.
+
+Inline buttons get their own, much shorter window: a repeat of the same
+button on the same message within a fraction of a second is a double-tap
+and is only acknowledged.
 """
 
 from __future__ import annotations
 
-import hashlib
 import logging
 import time
+from collections import OrderedDict, deque
+from hashlib import blake2b
 from typing import Any, Awaitable, Callable, Dict
 
 from aiogram import BaseMiddleware
-from aiogram.types import Message
+from aiogram.types import CallbackQuery, Message
 
 from bot.config import settings
 
@@ -21,13 +26,22 @@ logger = logging.getLogger(__name__)
 
 # Messages shorter than this skip dedup (form inputs: phones, cities, numbers)
 _DEDUP_MIN_LENGTH = 30
+# Hard cap on remembered fingerprints across all users
+_DEDUP_MAX_ENTRIES = 10_000
+# Hard cap on users with a live rate-limit window (least recently seen go first)
+_RATE_MAX_USERS = 50_000
+
+# Same button on the same message within this many seconds = double-tap
+_TAP_WINDOW = 0.3
+_TAP_MAX_ENTRIES = 1024
 
 
 class AntiSpamMiddleware(BaseMiddleware):
     def __init__(self) -> None:
         super().__init__()
-        self._rate: Dict[int, list[float]] = {}
-        self._dedup: Dict[int, Dict[str, float]] = {}
+        self._rate: OrderedDict[int, deque[float]] = OrderedDict()
+        # (uid, fingerprint) -> first-seen time; insertion order == time order
+        self._dedup: OrderedDict[tuple[int, bytes], float] = OrderedDict()
         self._last_cleanup: float = 0.0
 
     async def __call__(
@@ -40,7 +54,8 @@ class AntiSpamMiddleware(BaseMiddleware):
             return await handler(event, data)
 
         # Always let commands and contacts through
-        if event.text and event.text.startswith("/"):
+        text = event.text or ""
+        if text.startswith("/"):
             return await handler(event, data)
         if event.contact:
             return await handler(event, data)
@@ -53,30 +68,45 @@ class AntiSpamMiddleware(BaseMiddleware):
             self._cleanup(now)
             self._last_cleanup = now
 
-        # Rate limit
-        timestamps = self._rate.setdefault(uid, [])
-        cutoff = now - settings.RATE_LIMIT_SECONDS
-        timestamps[:] = [t for t in timestamps if t > cutoff]
-        if len(timestamps) >= settings.RATE_LIMIT_MESSAGES:
+        # Rate limit — the deque holds the last RATE_LIMIT_MESSAGES accepted
+        # timestamps; the user is over the limit iff it is full and even the
+        # oldest of them is still inside the window.
+        timestamps = self._rate.get(uid)
+        if timestamps is None:
+            timestamps = self._rate[uid] = deque(maxlen=settings.RATE_LIMIT_MESSAGES)
+            if len(self._rate) > _RATE_MAX_USERS:
+                self._rate.popitem(last=False)
+        else:
+            self._rate.move_to_end(uid)
+        if (
+            len(timestamps) == timestamps.maxlen
+            and timestamps[0] > now - settings.RATE_LIMIT_SECONDS
+        ):
             logger.warning("Rate-limit: user %d", uid)
             return None
-        timestamps.append(now)
+        timestamps.append(now)  # maxlen drops the oldest
 
         # Dedup — only for longer messages (not form inputs like phone numbers)
-        text = event.text or ""
         if len(text) >= _DEDUP_MIN_LENGTH:
-            h = hashlib.md5(text.encode()).hexdigest()
-            bucket = self._dedup.setdefault(uid, {})
-            # Purge expired entries for this user
-            bucket = {k: v for k, v in bucket.items() if now - v < settings.DEDUP_SECONDS}
-            self._dedup[uid] = bucket
-            if h in bucket:
+            self._expire_dedup(now)
+            # 64-bit fingerprint — only has to tell one user's recent messages apart
+            key = (uid, blake2b(text.encode(), digest_size=8).digest())
+            if key in self._dedup:
                 logger.warning("Dedup: user %d (msg len=%d)", uid, len(text))
                 return None
-            bucket[h] = now
+            self._dedup[key] = now
+            if len(self._dedup) > _DEDUP_MAX_ENTRIES:
+                self._dedup.popitem(last=False)
 
         return await handler(event, data)
 
+    def _expire_dedup(self, now: float) -> None:
+        """Drop fingerprints older than DEDUP_SECONDS (oldest sit at the head)."""
+        cutoff = now - settings.DEDUP_SECONDS
+        dedup = self._dedup
+        while dedup and next(iter(dedup.values())) <= cutoff:
+            dedup.popitem(last=False)
+
     def _cleanup(self, now: float) -> None:
         """Remove stale users from rate/dedup dicts to prevent memory leaks."""
         stale_rate = [
@@ -86,9 +116,35 @@ class AntiSpamMiddleware(BaseMiddleware):
         for uid in stale_rate:
             del self._rate[uid]
 
-        stale_dedup = [
-            uid for uid, bucket in self._dedup.items()
-            if not bucket
-        ]
-        for uid in stale_dedup:
-            del self._dedup[uid]
+        self._expire_dedup(now)
+
+
+class CallbackDedupMiddleware(BaseMiddleware):
+    def __init__(self) -> None:
+        super().__init__()
+        # (chat_id, message_id) -> (callback data, monotonic time of tap)
+        self._last: Dict[tuple[int, int], tuple[str, float]] = {}
+
+    async def __call__(
+        self,
+        handler: Callable[[CallbackQuery, Dict[str, Any]], Awaitable[Any]],
+        event: CallbackQuery,
+        data: Dict[str, Any],
+    ) -> Any:
+        if not isinstance(event, CallbackQuery) or event.message is None:
+            return await handler(event, data)
+
+        key = (event.message.chat.id, event.message.message_id)
+        cb_data = event.data or ""
+        now = time.monotonic()
+
+        prev = self._last.get(key)
+        if prev is not None and prev[0] == cb_data and now - prev[1] < _TAP_WINDOW:
+            await event.answer()
+            return None
+
+        if len(self._last) >= _TAP_MAX_ENTRIES:
+            self._last = {k: v for k, v in self._last.items() if now - v[1] < _TAP_WINDOW}
+        self._last[key] = (cb_data, now)
+
+        return await handler(event, data)
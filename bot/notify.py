@@ -0,0 +1,97 @@
+"""Admin notification queue.
+
+Lead notifications are pushed onto a bounded in-process queue and sent
+by a small pool of background workers, so a burst of submissions never
+fans out into a burst of concurrent Telegram calls.  Flood-control
+(429) replies are honoured by sleeping ``retry_after`` and re-queueing;
+network errors and Telegram 5xx are retried the same way with a short
+backoff.  ``enqueue`` only means "queued" — call ``drain`` on shutdown so
+pending alerts are sent before the session closes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramNetworkError, TelegramRetryAfter, TelegramServerError
+from aiogram.types import InlineKeyboardMarkup
+
+from bot.config import settings
+
+logger = logging.getLogger(__name__)
+
+_QUEUE_SIZE = 1000
+_MAX_ATTEMPTS = 3
+_RETRY_BACKOFF = 2  # seconds × attempt, for network/5xx failures
+
+_Job = tuple[int, str, InlineKeyboardMarkup | None, int]
+
+_queue: asyncio.Queue[_Job] | None = None
+_workers: list[asyncio.Task] = []
+
+
+def start_workers(bot: Bot) -> None:
+    """Spawn the sender pool (one worker per admin).  Idempotent."""
+    global _queue
+    if _workers:
+        return
+    _queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+    for _ in range(max(1, len(settings.admin_ids))):
+        _workers.append(asyncio.create_task(_worker(bot, _queue)))
+
+
+def enqueue(bot: Bot, chat_id: int, text: str, markup: InlineKeyboardMarkup | None = None) -> bool:
+    """Queue one message for delivery.  Returns False if the queue is full."""
+    start_workers(bot)
+    try:
+        _queue.put_nowait((chat_id, text, markup, 1))  # type: ignore[union-attr]
+    except asyncio.QueueFull:
+        logger.error("Notify queue full — dropping message for %s", chat_id)
+        return False
+    return True
+
+
+async def drain(timeout: float) -> bool:
+    """Wait up to *timeout* seconds for queued messages to be sent.
+
+    Returns False if messages were still pending when the wait ran out.
+    """
+    if _queue is None:
+        return True
+    try:
+        await asyncio.wait_for(_queue.join(), timeout)
+    except asyncio.TimeoutError:
+        logger.error("Notify queue not drained — %d message(s) left", _queue.qsize())
+        return False
+    return True
+
+
+async def _retry(queue: asyncio.Queue[_Job], job: _Job, delay: float, reason: object) -> None:
+    chat_id, text, markup, attempt = job
+    if attempt >= _MAX_ATTEMPTS:
+        logger.error("Notify admin %s failed after %d attempts: %s", chat_id, attempt, reason)
+        return
+    logger.warning("Notify %s failed (%s), retry in %ds", chat_id, reason, delay)
+    await asyncio.sleep(delay)
+    try:
+        queue.put_nowait((chat_id, text, markup, attempt + 1))
+    except asyncio.QueueFull:
+        logger.error("Notify queue full — dropping retry for %s", chat_id)
+
+
+async def _worker(bot: Bot, queue: asyncio.Queue[_Job]) -> None:
+    while True:
+        job = await queue.get()
+        chat_id, text, markup, attempt = job
+        try:
+            await bot.send_message(chat_id, text, reply_markup=markup)
+        except TelegramRetryAfter as exc:
+            await _retry(queue, job, exc.retry_after, "rate-limited")
+        except (TelegramNetworkError, TelegramServerError) as exc:
+            await _retry(queue, job, _RETRY_BACKOFF * attempt, exc)
+        except Exception as exc:
+            logger.error("Notify admin %s failed: %s", chat_id, exc)
+        finally:
+            queue.task_done()
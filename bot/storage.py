@@ -0,0 +1,87 @@
+"""Bounded in-memory FSM storage.
+
+aiogram's MemoryStorage keeps a record for every chat it is ever asked
+about (a plain ``get_state`` creates one) and never forgets it.  This
+variant keeps the same API but drops records that hold nothing, expires
+sessions idle for longer than ``ttl`` and caps the number of live
+sessions, evicting the least recently used.  An expired user simply
+lands in the "session expired" fallback, as after a restart.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import StateType, StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage, MemoryStorageRecord
+
+_MAX_SESSIONS = 20_000
+_SESSION_TTL = 24 * 3600  # seconds
+
+
+@dataclass
+class _Record(MemoryStorageRecord):
+    touched: float = 0.0
+
+
+class BoundedMemoryStorage(MemoryStorage):
+    def __init__(self, max_size: int = _MAX_SESSIONS, ttl: float = _SESSION_TTL) -> None:
+        super().__init__()
+        # Least recently used first — touching a record moves it to the end
+        self.storage: OrderedDict[StorageKey, _Record] = OrderedDict()  # type: ignore[assignment]
+        self._max_size = max_size
+        self._ttl = ttl
+
+    def _get(self, key: StorageKey) -> _Record | None:
+        rec = self.storage.get(key)
+        if rec is None:
+            return None
+        now = time.monotonic()
+        if now - rec.touched > self._ttl:
+            del self.storage[key]
+            return None
+        rec.touched = now
+        self.storage.move_to_end(key)
+        return rec
+
+    def _get_or_create(self, key: StorageKey) -> _Record:
+        rec = self._get(key)
+        if rec is None:
+            now = time.monotonic()
+            rec = self.storage[key] = _Record(touched=now)
+            self._evict(now)
+        return rec
+
+    def _evict(self, now: float) -> None:
+        storage = self.storage
+        while storage:
+            oldest = next(iter(storage.values()))
+            if len(storage) <= self._max_size and now - oldest.touched <= self._ttl:
+                break
+            storage.popitem(last=False)
+
+    def _drop_if_empty(self, key: StorageKey, rec: _Record) -> None:
+        if rec.state is None and not rec.data:
+            self.storage.pop(key, None)
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        rec = self._get_or_create(key)
+        rec.state = state.state if isinstance(state, State) else state
+        self._drop_if_empty(key, rec)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        rec = self._get(key)
+        return rec.state if rec else None
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        rec = self._get_or_create(key)
+        rec.data = data.copy()
+        self._drop_if_empty(key, rec)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        rec = self._get(key)
+        return rec.data.copy() if rec else {}